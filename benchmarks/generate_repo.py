@@ -0,0 +1,135 @@
+"""
+Generate a throwaway MkDocs + git repository for benchmarking.
+
+The history is written with `git fast-import`, so even tens of thousands of
+commits are created in a few seconds.
+
+    python benchmarks/generate_repo.py /tmp/bench-repo --docs 2000 --commits 20000
+"""
+import argparse
+import random
+import subprocess
+from pathlib import Path
+
+EN_WORDS = (
+    "the quick brown fox jumps over lazy dog documentation plugin build page "
+    "site date author commit history release update guide reference example "
+    "configuration theme markdown render cache index search navigation"
+).split()
+CJK_TEXT = "文档插件构建页面站点日期作者提交历史版本更新指南参考示例配置主题渲染缓存索引搜索导航"
+
+MKDOCS_YML = """site_name: Benchmark
+plugins:
+  - document-dates:
+      cache_dir: ''
+      recently-updated: true
+"""
+
+
+def _paragraph(rng: random.Random, cjk: bool) -> str:
+    if cjk:
+        return ''.join(rng.choice(CJK_TEXT) for _ in range(rng.randint(40, 160)))
+    return ' '.join(rng.choice(EN_WORDS) for _ in range(rng.randint(20, 80))).capitalize() + '.'
+
+
+def _document(rng: random.Random, title: str, cjk: bool) -> str:
+    parts = [f"# {title}", ""]
+    for i in range(rng.randint(3, 12)):
+        block = rng.random()
+        if block < 0.1:
+            parts.append("```python\nprint('hello')\nvalue = 42\n```")
+        elif block < 0.2:
+            parts.append("| a | b |\n| - | - |\n| 1 | 2 |")
+        elif block < 0.25:
+            parts.append(f"![image {i}](assets/img{i}.png)")
+        else:
+            parts.append(_paragraph(rng, cjk))
+        parts.append("")
+    return '\n'.join(parts)
+
+
+def _doc_paths(count: int, rng: random.Random):
+    sections = ['guide', 'api', 'blog', 'reference', 'generated/v1', 'generated/v2']
+    paths = ['index.md']
+    for i in range(1, count):
+        section = rng.choice(sections)
+        paths.append(f"{section}/page-{i:05d}.md")
+    return paths
+
+
+def _data(payload: str) -> bytes:
+    raw = payload.encode('utf-8')
+    return b"data %d\n" % len(raw) + raw + b"\n"
+
+
+def generate_repo(
+    target: Path,
+    docs: int = 500,
+    commits: int = 2000,
+    authors: int = 20,
+    coauthor_ratio: float = 0.1,
+    cjk_ratio: float = 0.3,
+    seed: int = 42,
+) -> Path:
+    """Create a git repo with `docs` Markdown files and `commits` commits under `target`."""
+    rng = random.Random(seed)
+    target = Path(target)
+    target.mkdir(parents=True, exist_ok=True)
+    subprocess.run(['git', 'init', '-q', '-b', 'main', str(target)], check=True)
+
+    people = [(f"Author {i}", f"author{i}@example.com") for i in range(max(1, authors))]
+    paths = _doc_paths(max(1, docs), rng)
+    cjk_docs = {path for path in paths if rng.random() < cjk_ratio}
+
+    stream = []
+    timestamp = 1_500_000_000
+    for n in range(1, max(commits, len(paths)) + 1):
+        name, email = rng.choice(people)
+        timestamp += rng.randint(60, 86_400)
+
+        message = f"Update docs #{n}\n"
+        if rng.random() < coauthor_ratio:
+            co_name, co_email = rng.choice(people)
+            message += f"\nCo-authored-by: {co_name} <{co_email}>\n"
+
+        # 先保证每个文档都被创建，之后随机修改
+        if n <= len(paths):
+            changed = [paths[n - 1]]
+        else:
+            changed = rng.sample(paths, k=min(len(paths), rng.randint(1, 3)))
+
+        stream.append(b"commit refs/heads/main\n")
+        stream.append(b"mark :%d\n" % n)
+        stream.append(f"author {name} <{email}> {timestamp} +0000\n".encode('utf-8'))
+        stream.append(f"committer {name} <{email}> {timestamp} +0000\n".encode('utf-8'))
+        stream.append(_data(message))
+        if n > 1:
+            stream.append(b"from :%d\n" % (n - 1))
+        if n == 1:
+            stream.append(b"M 100644 inline mkdocs.yml\n" + _data(MKDOCS_YML))
+        for path in changed:
+            content = _document(rng, f"{path} rev {n}", path in cjk_docs)
+            stream.append(f"M 100644 inline docs/{path}\n".encode('utf-8') + _data(content))
+        stream.append(b"\n")
+
+    subprocess.run(['git', 'fast-import', '--quiet'], cwd=target, input=b''.join(stream), check=True)
+    subprocess.run(['git', 'checkout', '-q', '-f', 'main'], cwd=target, check=True)
+    return target
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('target', type=Path)
+    parser.add_argument('--docs', type=int, default=500)
+    parser.add_argument('--commits', type=int, default=2000)
+    parser.add_argument('--authors', type=int, default=20)
+    parser.add_argument('--coauthor-ratio', type=float, default=0.1)
+    parser.add_argument('--cjk-ratio', type=float, default=0.3)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    generate_repo(args.target, args.docs, args.commits, args.authors, args.coauthor_ratio, args.cjk_ratio, args.seed)
+    print(args.target)
+
+
+if __name__ == '__main__':
+    main()
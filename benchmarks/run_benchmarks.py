@@ -0,0 +1,202 @@
+"""
+Benchmark the hot paths of mkdocs-document-dates against a synthetic repository.
+
+    python benchmarks/run_benchmarks.py --docs 2000 --commits 20000 --output bench.json
+
+Results are printed as JSON (and optionally written to --output), so runs can be
+compared before a release.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from generate_repo import generate_repo  # noqa: E402
+
+from mkdocs.config import load_config  # noqa: E402
+from mkdocs.structure.files import get_files  # noqa: E402
+from mkdocs.structure.pages import Page  # noqa: E402
+
+from mkdocs_document_dates import cache_manager, utils  # noqa: E402
+from mkdocs_document_dates.profiler import profiler  # noqa: E402
+
+
+@contextmanager
+def _chdir(path: Path):
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+
+
+def _measure(func, repeat: int, setup=None):
+    timings = []
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return {
+        'min': min(timings),
+        'mean': statistics.mean(timings),
+        'max': max(timings),
+        'runs': repeat,
+    }
+
+
+def _count_syscalls(func):
+    # 借助 profiler 的计数器统计一次调用中的文件系统系统调用（scandir / stat / statx）
+    profiler.enable()
+    profiler.reset()
+    try:
+        func()
+        counts = {}
+        for name in ('fs:scan', 'fs:stat'):
+            for key, value in profiler.stats.get(name, {}).items():
+                if key in ('scandir', 'stat', 'statx'):
+                    counts[key] = counts.get(key, 0) + value
+        return counts
+    finally:
+        profiler.disable()
+        profiler.reset()
+
+
+def _load_site(repo: Path):
+    config = load_config(str(repo / 'mkdocs.yml'))
+    config.plugins.on_startup(command='build', dirty=False)
+    config = config.plugins.on_config(config)
+    files = config.plugins.on_files(get_files(config), config=config)
+    plugin = config.plugins['document-dates']
+    return config, files, plugin
+
+
+def _read_pages(config, files):
+    pages = []
+    for file in files.documentation_pages():
+        page = Page(None, file, config)
+        page.read_source(config)
+        pages.append(page)
+    return pages
+
+
+def run_benchmarks(repo: Path, repeat: int = 3, scratch_dir: Path = None):
+    docs_dir = cache_manager.read_docs_dir(repo, repo / 'mkdocs.yml')
+    results = {}
+
+    # 默认清空进程内的 git 历史缓存，测量完整遍历；*_memo 为同一进程内再次构建的耗时
+    def cold():
+        utils.clear_git_history_memo()
+        return ()
+
+    results['load_git_metadata'] = _measure(lambda: utils.load_git_metadata(docs_dir), repeat, cold)
+    results['load_git_metadata_memo'] = _measure(lambda: utils.load_git_metadata(docs_dir), repeat)
+    results['load_git_last_updated_dates'] = _measure(lambda: utils.load_git_last_updated_dates(docs_dir), repeat, cold)
+
+    config, files, plugin = _load_site(repo)
+    results['load_dates_and_authors'] = _measure(lambda: utils.load_dates_and_authors(docs_dir, files), repeat, cold)
+    results['load_dates_and_authors']['syscalls'] = _count_syscalls(lambda: utils.load_dates_and_authors(docs_dir, files))
+    results['scan_file_stats'] = _measure(lambda: utils.scan_file_stats(docs_dir), repeat)
+    results['scan_file_stats']['syscalls'] = _count_syscalls(lambda: utils.scan_file_stats(docs_dir))
+
+    sources = [Path(file.abs_src_path).read_text(encoding='utf-8') for file in files.documentation_pages()]
+    results['analyze_markdown'] = _measure(lambda: [utils.analyze_markdown(md) for md in sources], repeat)
+
+    def page_markdown_setup():
+        _, _, fresh_plugin = _load_site(repo)
+        return fresh_plugin, _read_pages(config, files)
+
+    def page_markdown(fresh_plugin, pages):
+        for page in pages:
+            fresh_plugin.on_page_markdown(page.markdown, page=page, config=config, files=files)
+
+    results['on_page_markdown'] = _measure(page_markdown, repeat, page_markdown_setup)
+
+    def on_env_setup():
+        site_config, site_files, fresh_plugin = _load_site(repo)
+        _read_pages(site_config, site_files)
+        return fresh_plugin, site_config, site_files
+
+    results['on_env'] = _measure(
+        lambda fresh_plugin, site_config, site_files: fresh_plugin.on_env(site_config.theme.get_env(), config=site_config, files=site_files),
+        repeat,
+        on_env_setup,
+    )
+
+    # update_cache 会删除并重新生成 .dates_cache.jsonl，只在临时克隆中运行，避免破坏 --repo 指定的项目
+    git_root = Path(subprocess.check_output(['git', 'rev-parse', '--show-toplevel'], cwd=repo, encoding='utf-8').strip()).resolve()
+    clone = Path(tempfile.mkdtemp(prefix='mdd-bench-clone-', dir=scratch_dir))
+    subprocess.run(['git', 'clone', '-q', '--no-hardlinks', str(git_root), str(clone)], check=True)
+    clone_docs_dir = clone / docs_dir.relative_to(git_root)
+
+    def update_cache_setup():
+        cache_file = clone_docs_dir / '.dates_cache.jsonl'
+        if cache_file.exists():
+            subprocess.run(['git', 'rm', '-q', '--cached', '--ignore-unmatch', str(cache_file)], cwd=clone, check=True)
+            cache_file.unlink()
+        return ()
+
+    def update_cache():
+        with _chdir(clone):
+            cache_manager.update_cache()
+
+    results['update_cache'] = _measure(update_cache, repeat, update_cache_setup)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repo', type=Path, help='use an existing repository instead of generating one')
+    parser.add_argument('--docs', type=int, default=500)
+    parser.add_argument('--commits', type=int, default=2000)
+    parser.add_argument('--authors', type=int, default=20)
+    parser.add_argument('--coauthor-ratio', type=float, default=0.1)
+    parser.add_argument('--cjk-ratio', type=float, default=0.3)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', type=Path, help='write the JSON report to this file')
+    args = parser.parse_args()
+
+    params = {
+        'docs': args.docs,
+        'commits': args.commits,
+        'authors': args.authors,
+        'coauthor_ratio': args.coauthor_ratio,
+        'cjk_ratio': args.cjk_ratio,
+        'repeat': args.repeat,
+    }
+
+    with tempfile.TemporaryDirectory(prefix='mdd-bench-') as tmp:
+        if args.repo:
+            repo = args.repo.resolve()
+            params = {'repo': str(repo), 'repeat': args.repeat}
+        else:
+            repo = generate_repo(
+                Path(tmp) / 'repo', args.docs, args.commits, args.authors, args.coauthor_ratio, args.cjk_ratio
+            )
+        results = run_benchmarks(repo, args.repeat, Path(tmp))
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': params,
+        'results': results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + '\n', encoding='utf-8')
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+import os
+import re
+import shutil
+import hashlib
+from pathlib import Path
+from typing import Optional
+from .utils import ensure_cache_dir
+
+STATIC_DIR = Path(__file__).parent / 'static'
+ASSETS_URL = 'assets/document_dates'
+
+
+# ===== Minify =====
+CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+CSS_SPACE_RE = re.compile(r"\s+")
+CSS_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+CSS_URL_RE = re.compile(r"url\(\s*(['\"]?)([^'\")]+)\1\s*\)")
+
+
+def _is_license_comment(comment: str) -> bool:
+    # 与常见压缩工具一致，保留 /*! ... */ 和含 @license 的注释（许可证声明）
+    return comment.startswith("/*!") or "@license" in comment
+
+
+def minify_css(css: str) -> str:
+    css = CSS_COMMENT_RE.sub(lambda m: m.group(0) if _is_license_comment(m.group(0)) else "", css)
+    css = CSS_SPACE_RE.sub(" ", css)
+    css = CSS_PUNCT_RE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(js: str) -> str:
+    # 保守的按行压缩：只移除行首注释、缩进和空行，不改动语句本身；许可证注释原样保留
+    lines = []
+    comment = None
+    for line in js.splitlines():
+        stripped = line.strip()
+        if comment is not None:
+            end = stripped.find("*/")
+            comment.append(stripped if end == -1 else stripped[:end + 2])
+            if end == -1:
+                continue
+            if _is_license_comment("\n".join(comment)):
+                lines.extend(comment)
+            comment = None
+            stripped = stripped[end + 2:].strip()
+        if stripped.startswith("/*"):
+            end = stripped.find("*/", 2)
+            if end == -1:
+                comment = [stripped]
+                continue
+            if _is_license_comment(stripped[:end + 2]):
+                lines.append(stripped[:end + 2])
+            stripped = stripped[end + 2:].strip()
+        if not stripped or stripped.startswith("//"):
+            continue
+        lines.append(stripped)
+    return "\n".join(lines)
+
+
+def rewrite_css_urls(css: str, base: str) -> str:
+    # CSS 合并后位置改变，将相对 url() 改写为相对于 assets/document_dates/ 的路径
+    if not base:
+        return css
+
+    def repl(match):
+        quote, url = match.groups()
+        if url.startswith(('http:', 'https:', 'data:', '/', '#')):
+            return match.group(0)
+        if url.startswith('./'):
+            url = url[2:]
+        return f"url({quote}{base}/{url}{quote})"
+
+    return CSS_URL_RE.sub(repl, css)
+
+
+# ===== Bundle =====
+def build_bundle(sources, kind: str):
+    """
+    合并、压缩 CSS 或 JS，文件名包含内容哈希，可被 CDN 永久缓存
+        sources: [(源文件路径, 相对于 assets/document_dates/ 的目录), ...]
+    只压缩插件自己的源文件：
+        - 用户的 config.css / config.js 原样合并（按行压缩可能改动多行模板字符串等内容）
+        - 已压缩的第三方文件（*.min.js / *.min.css）原样合并，保留其许可证声明
+    返回: (文件名, 内容)
+    """
+    static_dir = STATIC_DIR.resolve()
+    parts = []
+    for path, base in sources:
+        path = Path(path)
+        content = path.read_text(encoding='utf-8')
+        minify = static_dir in path.resolve().parents and not path.name.endswith(('.min.js', '.min.css'))
+        if kind == 'css':
+            content = rewrite_css_urls(content, base)
+            parts.append(minify_css(content) if minify else content)
+        else:
+            parts.append(minify_js(content) if minify else content)
+
+    # JS 之间用分号分隔，避免上一个文件末尾缺少分号
+    content = ("\n" if kind == 'css' else "\n;\n").join(parts) + "\n"
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+    return f"document-dates.{digest}.{kind}", content
+
+
+# ===== Publish =====
+_digest_cache = {}
+
+
+def file_digest(path: Path, stat=None) -> str:
+    # 以 (路径, 大小, mtime) 为键缓存文件哈希，同一文件只读取一次
+    stat = stat or path.stat()
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    digest = _digest_cache.get(key)
+    if digest is None:
+        digest = _digest_cache[key] = hashlib.md5(path.read_bytes()).hexdigest()
+    return digest
+
+
+def publish_assets(assets, site_dir: Path, published=None) -> int:
+    """
+    只发布当前配置实际引用的文件，目标文件大小和哈希一致时跳过
+        assets: [(源文件路径, 站点内相对路径), ...]
+        published: 上次发布后目标文件的状态，未变化时连哈希都不必计算
+    安装包中的源文件总是复制，不做硬链接，站点文件被后处理工具原地修改时不会影响插件本身
+    返回: 实际写入的文件数
+    """
+    published = {} if published is None else published
+    written = 0
+    for source, rel_path in assets:
+        dest = site_dir / rel_path
+        try:
+            dest_stat = dest.stat()
+        except FileNotFoundError:
+            dest_stat = None
+
+        if dest_stat is not None:
+            state = (dest_stat.st_size, dest_stat.st_mtime_ns, dest_stat.st_ino)
+            if published.get(dest) == state:
+                continue
+            source_stat = source.stat()
+            if dest_stat.st_size == source_stat.st_size and file_digest(dest, dest_stat) == file_digest(source, source_stat):
+                published[dest] = state
+                continue
+            dest.unlink()
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, dest)
+
+        dest_stat = dest.stat()
+        published[dest] = (dest_stat.st_size, dest_stat.st_mtime_ns, dest_stat.st_ino)
+        written += 1
+    return written
+
+
+def _link_from_cache(data: bytes, dest: Path, cache_dir: Path) -> bool:
+    # 缓存目录中的副本内容不符（如被站点后处理工具通过硬链接改写）时重新写入，再硬链接到站点
+    cached = cache_dir / dest.name
+    try:
+        if not cached.is_file() or cached.stat().st_size != len(data) or cached.read_bytes() != data:
+            ensure_cache_dir(cache_dir)
+            temp_file = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+            temp_file.write_bytes(data)
+            temp_file.replace(cached)
+        os.link(cached, dest)
+        return True
+    except OSError:
+        return False
+
+
+def publish_content(content: str, dest: Path, cache_dir: Optional[Path] = None) -> bool:
+    """
+    发布合并后的资源文件，文件名已包含内容哈希，存在且大小一致即可跳过
+        cache_dir: 指定时从缓存目录中的副本硬链接到站点（无法链接时写入），只用于插件自己生成的文件
+    """
+    data = content.encode('utf-8')
+    try:
+        if dest.stat().st_size == len(data):
+            return False
+        # 先删除，避免改写与其他位置共享 inode 的旧文件
+        dest.unlink()
+    except FileNotFoundError:
+        pass
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if cache_dir is None or not _link_from_cache(data, dest, cache_dir):
+        dest.write_bytes(data)
+    return True
@@ -1,15 +1,21 @@
 import logging
 import yaml
+import json
 import os
 import subprocess
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from logging.handlers import RotatingFileHandler
 from typing import Optional
-from .utils import read_jsonl_cache, write_jsonl_cache, load_file_creation_date, load_git_first_commit_date
+from .utils import env_truthy, read_jsonl_cache, read_jsonl_cache_entries, write_jsonl_cache, append_jsonl_cache, needs_compaction, git_add, load_file_creation_date, load_git_first_commit_dates
 
 logger = logging.getLogger("mkdocs.plugins.document_dates")
 _LOGGING_CONFIGURED = False
 
+PROJECT_CACHE_VERSION = 1
+MAX_PROJECT_WORKERS = 8
+
 CONFIG_PRIORITY = {
     "mkdocs.yml": 0,
     "properdocs.yml": 1,
@@ -62,14 +68,6 @@ def configure_file_logging(log_file: Optional[Path] = None, level: int = logging
     logger.debug(f"File logging enabled: {log_file}")
     return log_file
 
-def _env_truthy(name: str) -> bool:
-    value = os.getenv(name)
-    if value is None:
-        return False
-    value = value.strip().lower()
-    return value not in ("", "0", "false", "no", "off")
-
-
 def _clean_git_env():
     env = os.environ.copy()
 
@@ -88,29 +86,50 @@ def _clean_git_env():
 
     return env
 
+def _find_git_root():
+    # 返回 (git 根目录, git common 目录)
+    git_root, common_dir = subprocess.check_output(
+        ["git", "rev-parse", "--show-toplevel", "--git-common-dir"],
+        env=_clean_git_env(),
+        encoding="utf-8"
+    ).splitlines()
+    return Path(git_root), (Path.cwd() / common_dir).resolve()
+
+def _list_config_files(git_root: Path) -> dict[str, str]:
+    # 只查询 git 已跟踪的配置文件（读取索引，无需遍历工作区），返回 {相对路径: 暂存区对象哈希}
+    cmd = ["git", "-c", "core.quotepath=false", "ls-files", "-s", "-z", "--"]
+    cmd.extend(f":(icase)*{name}" for name in CONFIG_PRIORITY)
+    output = subprocess.check_output(cmd, cwd=git_root, env=_clean_git_env(), encoding="utf-8")
+
+    config_files = {}
+    for record in output.split("\0"):
+        meta, sep, rel_path = record.partition("\t")
+        if not sep or rel_path.rpartition("/")[2].lower() not in CONFIG_PRIORITY:
+            continue
+        config_files[rel_path] = meta.split()[1]
+    return config_files
+
+def _select_projects(git_root: Path, config_files) -> dict[Path, Path]:
+    projects = {}
+    for rel_path in config_files:
+        config_file = git_root / rel_path
+        name = config_file.name.lower()
+
+        project_dir = config_file.parent
+        existing = projects.get(project_dir)
+        if existing is None:
+            projects[project_dir] = config_file
+            continue
+        if CONFIG_PRIORITY[name] < CONFIG_PRIORITY[existing.name.lower()]:
+            projects[project_dir] = config_file
+    return projects
+
 def find_mkdocs_projects() -> dict[Path, Path]:
     projects = {}
 
     try:
-        git_root = Path(subprocess.check_output(
-            ["git", "rev-parse", "--show-toplevel"],
-            env=_clean_git_env(),
-            encoding="utf-8"
-        ).strip())
-
-        for pattern in ("*.yml", "*.yaml"):
-            for config_file in git_root.rglob(pattern):
-                name = config_file.name.lower()
-                if name not in CONFIG_PRIORITY:
-                    continue
-
-                project_dir = config_file.parent
-                existing = projects.get(project_dir)
-                if existing is None:
-                    projects[project_dir] = config_file
-                    continue
-                if CONFIG_PRIORITY[name] < CONFIG_PRIORITY[existing.name.lower()]:
-                    projects[project_dir] = config_file
+        git_root, _ = _find_git_root()
+        projects = _select_projects(git_root, _list_config_files(git_root))
 
         if not projects:
             logger.warning("No MkDocs/ProperDocs projects found in the repository")
@@ -122,6 +141,87 @@ def find_mkdocs_projects() -> dict[Path, Path]:
 
     return projects
 
+def read_docs_dir(project_dir: Path, mkdocs_yml: Path) -> Path:
+    docs_dir = project_dir / "docs"
+
+    # 从 mkdocs.yml 中读取 docs_dir 配置覆盖默认值
+    try:
+        mkdocs_config = yaml.load(
+            mkdocs_yml.read_text(encoding="utf-8"),
+            Loader=yaml.BaseLoader,
+        ) or {}
+
+        docs_dir_name = mkdocs_config.get("docs_dir") or "docs"
+        docs_dir = (project_dir / docs_dir_name).resolve(strict=False)
+    except (IOError, OSError, yaml.YAMLError) as e:
+        logger.warning(f"Failed to read docs_dir: {e}")
+    return docs_dir
+
+def _config_files_key(git_root: Path, config_files) -> list:
+    # 暂存区哈希 + 工作区文件的 mtime 和大小，任一配置文件变化（或增删）都会使缓存失效
+    key = []
+    for rel_path, blob in sorted(config_files.items()):
+        try:
+            stat = (git_root / rel_path).stat()
+            key.append([rel_path, blob, stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            key.append([rel_path, blob, None, None])
+    return key
+
+def discover_projects() -> dict[Path, tuple[Path, Path]]:
+    """
+    查找仓库中的所有 MkDocs/ProperDocs 项目，返回 {项目目录: (配置文件, docs 目录)}
+    设置环境变量 MKDOCS_DOCUMENT_DATES_PROJECT_CACHE 后，结果缓存在 .git 目录中，配置文件不变时无需再解析
+    """
+    if not env_truthy("MKDOCS_DOCUMENT_DATES_PROJECT_CACHE"):
+        return {
+            project_dir: (mkdocs_yml, read_docs_dir(project_dir, mkdocs_yml))
+            for project_dir, mkdocs_yml in find_mkdocs_projects().items()
+        }
+
+    try:
+        git_root, common_dir = _find_git_root()
+        config_files = _list_config_files(git_root)
+    except Exception as e:
+        logger.error(f"Failed to list MkDocs/ProperDocs config files: {e}")
+        return {}
+
+    key = _config_files_key(git_root, config_files)
+    cache_file = common_dir / "mkdocs-document-dates" / "projects.json"
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        if cached.get("version") == PROJECT_CACHE_VERSION and cached.get("root") == str(git_root) and cached.get("key") == key:
+            return {
+                Path(project_dir): (Path(mkdocs_yml), Path(docs_dir))
+                for project_dir, mkdocs_yml, docs_dir in cached["projects"]
+            }
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    projects = {
+        project_dir: (mkdocs_yml, read_docs_dir(project_dir, mkdocs_yml))
+        for project_dir, mkdocs_yml in _select_projects(git_root, config_files).items()
+    }
+    if not projects:
+        logger.warning("No MkDocs/ProperDocs projects found in the repository")
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_suffix(".json.tmp")
+        temp_file.write_text(json.dumps({
+            "version": PROJECT_CACHE_VERSION,
+            "root": str(git_root),
+            "key": key,
+            "projects": [
+                [str(project_dir), str(mkdocs_yml), str(docs_dir)]
+                for project_dir, (mkdocs_yml, docs_dir) in projects.items()
+            ],
+        }), encoding="utf-8")
+        temp_file.replace(cache_file)
+    except OSError as e:
+        logger.debug(f"Failed to write project cache {cache_file}: {e}")
+    return projects
+
 def setup_gitattributes(docs_dir: Path):
     try:
         gitattributes_path = docs_dir / ".gitattributes"
@@ -133,7 +233,7 @@ def setup_gitattributes(docs_dir: Path):
                 content += "\n"
             content += f"{union_merge_line}\n"
             gitattributes_path.write_text(content, encoding="utf-8")
-            subprocess.run(["git", "add", str(gitattributes_path)], cwd=docs_dir, env=_clean_git_env(), check=True)
+            git_add(gitattributes_path, cwd=docs_dir, env=_clean_git_env())
             logger.info(f"Updated .gitattributes file: {gitattributes_path}")
             return True
     except (IOError, OSError) as e:
@@ -142,88 +242,222 @@ def setup_gitattributes(docs_dir: Path):
         logger.error(f"Failed to add .gitattributes to git: {e}")
     return False
 
-def update_cache():
-    if os.getenv("MKDOCS_DOCUMENT_DATES_LOG_FILE"):
-        configure_file_logging()
-    elif _env_truthy("MKDOCS_DOCUMENT_DATES_DEBUG"):
-        configure_file_logging(_default_log_file())
+def _staged_changes(docs_dir: Path):
+    """
+    docs 目录下暂存的 Markdown 变更（含重命名检测）
+    返回: [(状态, 旧路径, 新路径), ...]，非重命名/复制时旧路径为 None
+    """
+    env = _clean_git_env()
+    # git commit -a 等情况下，暂存内容在 GIT_INDEX_FILE 指定的临时索引中（可能为相对于仓库根目录的路径）
+    index_file = os.getenv("GIT_INDEX_FILE")
+    if index_file:
+        env["GIT_INDEX_FILE"] = os.path.abspath(index_file)
+
+    cmd = ["git", "-c", "core.quotepath=false", "diff", "--cached", "--name-status", "-M", "-z", "--relative", "--", "*.md"]
+    fields = subprocess.check_output(cmd, cwd=docs_dir, env=env, encoding="utf-8").split("\0")
+
+    changes = []
+    i = 0
+    while i < len(fields) and fields[i]:
+        status = fields[i][0]
+        if status in ("R", "C"):
+            changes.append((status, fields[i + 1], fields[i + 2]))
+            i += 3
+        else:
+            changes.append((status, None, fields[i + 1]))
+            i += 2
+    return changes
+
+def update_project_staged(docs_dir: Path, jsonl_cache_file: Path) -> bool:
+    # 只处理本次提交暂存的变更，耗时与提交大小相关，而与仓库大小无关
+    changes = _staged_changes(docs_dir)
+    if not changes:
+        return False
 
-    global_updated = False
-    for project_dir, mkdocs_yml in find_mkdocs_projects().items():
+    # 只解析本次变更涉及的条目，变更以追加行的方式写入
+    wanted = {rel_path for _, _, rel_path in changes} | {old_path for _, old_path, _ in changes if old_path}
+    existing, lines, live = read_jsonl_cache_entries(jsonl_cache_file, wanted)
+
+    updates = {}
+    for status, old_path, rel_path in changes:
         try:
-            project_updated = False
+            # 删除：写入删除标记
+            if status == "D":
+                if rel_path in existing:
+                    updates[rel_path] = None
+                continue
 
-            docs_dir = project_dir / "docs"
+            # 重命名：沿用旧路径的创建日期
+            if status == "R":
+                file_info = existing.get(old_path)
+                if file_info is not None:
+                    updates[old_path] = None
+                    if rel_path not in existing:
+                        updates[rel_path] = file_info
+
+            # 新增、复制，以及缓存中缺失的文件：使用文件系统创建日期
+            if rel_path not in existing and updates.get(rel_path) is None and status in ("A", "C", "R", "M"):
+                full_path = docs_dir / rel_path
+                if full_path.exists():
+                    created_time = load_file_creation_date(full_path)
+                    updates[rel_path] = {
+                        "created": int(created_time.timestamp())
+                    }
+        except Exception as e:
+            logger.error(f"Error processing file {rel_path}: {e}")
+            continue
 
-            # 从 mkdocs.yml 中读取 docs_dir 配置覆盖默认值
-            try:
-                mkdocs_config = yaml.load(
-                    mkdocs_yml.read_text(encoding="utf-8"),
-                    Loader=yaml.BaseLoader,
-                ) or {}
-
-                docs_dir_name = mkdocs_config.get("docs_dir") or "docs"
-                docs_dir = (project_dir / docs_dir_name).resolve(strict=False)
-            except (IOError, OSError, yaml.YAMLError) as e:
-                logger.warning(f"Failed to read docs_dir: {e}")
-
-            if not docs_dir.is_dir():
-                logger.info(f"Document directory does not exist: {docs_dir}")
-                continue
+    if not updates:
+        return False
 
-            # 设置.gitattributes文件
-            global_updated |= setup_gitattributes(docs_dir)
+    # 追加行过多时整体重写（压缩），去掉重复行和删除标记
+    live += sum(1 if file_info is not None else -1 for file_info in updates.values())
+    if needs_compaction(lines + len(updates), live):
+        jsonl_dates_cache = read_jsonl_cache(jsonl_cache_file)
+        for rel_path, file_info in updates.items():
+            if file_info is None:
+                jsonl_dates_cache.pop(rel_path, None)
+            else:
+                jsonl_dates_cache[rel_path] = file_info
+        return write_jsonl_cache(jsonl_cache_file, jsonl_dates_cache, sorted(jsonl_dates_cache))
+    return append_jsonl_cache(jsonl_cache_file, updates)
+
+class _ProjectLogFilter(logging.Filter):
+    # 并发处理项目时，工作线程的日志先暂存，项目处理完后再按项目顺序输出，避免不同项目的日志交错
+    def __init__(self):
+        super().__init__()
+        self.local = threading.local()
+
+    def filter(self, record):
+        records = getattr(self.local, "records", None)
+        if records is None:
+            return True
+        records.append(record)
+        return False
 
-            # 获取docs目录下已跟踪(tracked)的markdown文件
-            cmd = ["git", "-c", "core.quotepath=false", "ls-files", "*.md"]
-            result = subprocess.run(cmd, cwd=docs_dir, env=_clean_git_env(), capture_output=True, encoding="utf-8")
-            tracked_files = result.stdout.splitlines() if result.stdout else []
+    def run(self, func, *args):
+        records = self.local.records = []
+        try:
+            return func(*args), records
+        finally:
+            self.local.records = None
 
-            if not tracked_files:
-                logger.info(f"No tracked markdown files found in {docs_dir}")
-                continue
+_project_log_filter = _ProjectLogFilter()
+logger.addFilter(_project_log_filter)
+
+def _project_workers(project_count: int) -> int:
+    # 可通过环境变量 MKDOCS_DOCUMENT_DATES_JOBS 指定并发数，1 表示逐个处理
+    try:
+        workers = int(os.getenv("MKDOCS_DOCUMENT_DATES_JOBS", ""))
+    except ValueError:
+        workers = min(MAX_PROJECT_WORKERS, os.cpu_count() or 1)
+    return max(1, min(workers, project_count))
+
+def update_project(project_dir: Path, docs_dir: Path, full_sync: bool = False) -> bool:
+    try:
+        project_updated = False
+        global_updated = False
+
+        if not docs_dir.is_dir():
+            logger.info(f"Document directory does not exist: {docs_dir}")
+            return False
+
+        # 设置.gitattributes文件
+        global_updated |= setup_gitattributes(docs_dir)
+
+        # 增量模式：只处理暂存的变更
+        jsonl_cache_file = docs_dir / ".dates_cache.jsonl"
+        if not full_sync and jsonl_cache_file.exists():
+            global_updated |= update_project_staged(docs_dir, jsonl_cache_file)
+            return global_updated
+
+        # 获取docs目录下已跟踪(tracked)的markdown文件
+        cmd = ["git", "-c", "core.quotepath=false", "ls-files", "*.md"]
+        result = subprocess.run(cmd, cwd=docs_dir, env=_clean_git_env(), capture_output=True, encoding="utf-8")
+        tracked_files = result.stdout.splitlines() if result.stdout else []
+
+        if not tracked_files:
+            logger.info(f"No tracked markdown files found in {docs_dir}")
+            return global_updated
+
+        # 读取 JSONL 缓存
+        jsonl_dates_cache = read_jsonl_cache(jsonl_cache_file)
 
-            # 读取 JSONL 缓存
-            jsonl_cache_file = docs_dir / ".dates_cache.jsonl"
-            jsonl_dates_cache = read_jsonl_cache(jsonl_cache_file)
-
-            # 根据 git已跟踪的文件来更新
-            for rel_path in tracked_files:
-                try:
-                    # 如果文件已在 JSONL 缓存中，跳过
-                    if rel_path in jsonl_dates_cache:
-                        continue
-
-                    full_path = docs_dir / rel_path
-                    if full_path.exists():
-                        created_time = load_file_creation_date(full_path)
-                        if not jsonl_cache_file.exists():
-                            git_time = load_git_first_commit_date(full_path)
-                            if git_time:
-                                created_time = min(created_time, git_time)
-                        jsonl_dates_cache[rel_path] = {
-                            "created": int(created_time.timestamp())
-                        }
-                        project_updated = True
-                except Exception as e:
-                    logger.error(f"Error processing file {rel_path}: {e}")
+        # 首次生成缓存时，单次遍历 git 历史获取所有文件的首次提交时间（按需加载）
+        git_first_dates = None
+
+        # 根据 git已跟踪的文件来更新
+        for rel_path in tracked_files:
+            try:
+                # 如果文件已在 JSONL 缓存中，跳过
+                if rel_path in jsonl_dates_cache:
                     continue
 
-            # 标记删除不再跟踪的文件
-            if len(jsonl_dates_cache) > len(tracked_files):
-                project_updated = True
+                full_path = docs_dir / rel_path
+                if full_path.exists():
+                    created_time = load_file_creation_date(full_path)
+                    if not jsonl_cache_file.exists():
+                        if git_first_dates is None:
+                            git_first_dates = load_git_first_commit_dates(docs_dir)
+                        git_time = git_first_dates.get(rel_path)
+                        if git_time:
+                            created_time = min(created_time, git_time)
+                    jsonl_dates_cache[rel_path] = {
+                        "created": int(created_time.timestamp())
+                    }
+                    project_updated = True
+            except Exception as e:
+                logger.error(f"Error processing file {rel_path}: {e}")
+                continue
 
-            # 如果有更新，写入 JSONL 缓存文件
-            if project_updated or not jsonl_cache_file.exists():
-                global_updated |= write_jsonl_cache(jsonl_cache_file, jsonl_dates_cache, tracked_files)
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to execute git command: {e}")
-            continue
-        except Exception as e:
-            logger.error(f"Error processing project directory {project_dir}: {e}")
-            continue
-    return global_updated
+        # 标记删除不再跟踪的文件
+        if len(jsonl_dates_cache) > len(tracked_files):
+            project_updated = True
+
+        # 如果有更新，写入 JSONL 缓存文件
+        if project_updated or not jsonl_cache_file.exists():
+            global_updated |= write_jsonl_cache(jsonl_cache_file, jsonl_dates_cache, tracked_files)
+        return global_updated
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Failed to execute git command: {e}")
+    except Exception as e:
+        logger.error(f"Error processing project directory {project_dir}: {e}")
+    return False
 
+def update_cache(full_sync: bool = False):
+    """
+    更新各项目的 .dates_cache.jsonl
+    缓存文件已存在时默认只处理暂存的变更；full_sync 或环境变量 MKDOCS_DOCUMENT_DATES_FULL_SYNC
+    会对照全部已跟踪文件重新同步（用于修复跳过钩子的提交造成的差异）
+    多个项目时并发处理（git add 串行执行），日志按项目顺序输出
+    """
+    if os.getenv("MKDOCS_DOCUMENT_DATES_LOG_FILE"):
+        configure_file_logging()
+    elif env_truthy("MKDOCS_DOCUMENT_DATES_DEBUG"):
+        configure_file_logging(_default_log_file())
+
+    full_sync = full_sync or env_truthy("MKDOCS_DOCUMENT_DATES_FULL_SYNC")
+    projects = [(project_dir, docs_dir) for project_dir, (_, docs_dir) in discover_projects().items()]
+    workers = _project_workers(len(projects))
+
+    global_updated = False
+    if workers <= 1:
+        for project_dir, docs_dir in projects:
+            global_updated |= update_project(project_dir, docs_dir, full_sync)
+        return global_updated
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_project_log_filter.run, update_project, project_dir, docs_dir, full_sync)
+            for project_dir, docs_dir in projects
+        ]
+        # 按提交顺序取结果，前面的项目完成后即可输出其日志
+        for future in futures:
+            project_updated, records = future.result()
+            for record in records:
+                logger.handle(record)
+            global_updated |= project_updated
+    return global_updated
 
 if __name__ == "__main__":
     update_cache()
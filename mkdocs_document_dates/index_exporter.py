@@ -0,0 +1,79 @@
+import sys
+import argparse
+import subprocess
+from pathlib import Path
+from .cache_manager import CONFIG_PRIORITY, read_docs_dir
+from .utils import scan_git_history, write_dates_index
+
+DEFAULT_INDEX_FILENAME = "document-dates-index.json"
+
+
+class IndexExportError(Exception):
+    pass
+
+
+def find_config_file(project_dir: Path) -> Path:
+    for name in sorted(CONFIG_PRIORITY, key=CONFIG_PRIORITY.get):
+        config_file = project_dir / name
+        if config_file.is_file():
+            return config_file
+    raise IndexExportError(f"No MkDocs/ProperDocs config file found in {project_dir}. Use --config-file to specify one.")
+
+
+def read_git_head(docs_dir: Path, allow_shallow: bool) -> str:
+    result = subprocess.run(
+        ["git", "rev-parse", "--is-shallow-repository", "HEAD"],
+        cwd=docs_dir,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0 or not result.stdout.strip():
+        raise IndexExportError("This command must be run inside a Git repo with at least one commit.")
+
+    is_shallow, head = result.stdout.split()
+    # 浅克隆缺少早期提交，导出的创建日期和作者都不完整
+    if is_shallow == "true" and not allow_shallow:
+        raise IndexExportError("The repository is a shallow clone, run `git fetch --unshallow` first (or pass --allow-shallow).")
+    return head
+
+
+def export(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="mdd-index",
+        description="Export the dates/authors index of a MkDocs/ProperDocs project, so builds can skip git entirely",
+    )
+    parser.add_argument("-f", "--config-file", type=Path, help="config file of the project (default: mkdocs.yml in the current directory)")
+    parser.add_argument("-o", "--output", type=Path, help=f"output file, a .gz suffix enables compression (default: {DEFAULT_INDEX_FILENAME} next to the config file)")
+    parser.add_argument("--allow-shallow", action="store_true", help="export even if the repository is a shallow clone")
+    args = parser.parse_args(argv)
+
+    try:
+        config_file = args.config_file or find_config_file(Path.cwd())
+        if not config_file.is_file():
+            raise IndexExportError(f"Config file not found: {config_file}")
+        project_dir = config_file.resolve().parent
+
+        docs_dir = read_docs_dir(project_dir, config_file)
+        if not docs_dir.is_dir():
+            raise IndexExportError(f"Document directory does not exist: {docs_dir}")
+
+        head = read_git_head(docs_dir, args.allow_shallow)
+        history = scan_git_history(docs_dir)
+        if not history:
+            raise IndexExportError(f"No Markdown files found in the Git history of {docs_dir}")
+
+        output = args.output or project_dir / DEFAULT_INDEX_FILENAME
+        write_dates_index(output, history, head)
+
+        print(f"✔ Dates index exported: {output} ({len(history)} files, {head[:7]})")
+        return 0
+
+    except IndexExportError as e:
+        print(f"✖ Export failed: {e}", file=sys.stderr)
+    except Exception as e:
+        print(f"✖ Unexpected error: {e}", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(export())
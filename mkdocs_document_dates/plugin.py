@@ -1,6 +1,11 @@
+import os
+import re
+import json
 import yaml
-import shutil
+import hashlib
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from jinja2 import ChoiceLoader, FileSystemLoader
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,14 +14,27 @@ from mkdocs.config import config_options
 from mkdocs.structure.pages import Page
 from mkdocs.utils import get_relative_url
 from urllib.parse import urlparse
-from babel.dates import format_datetime
-from .utils import compile_exclude_patterns, is_excluded, get_recently_updated_files, load_dates_and_authors, DEFAULT_WPM, DEFAULT_WPM_CJK
+from babel.core import Locale
+from babel.dates import LC_TIME, parse_pattern, tokenize_pattern
+from .profiler import profiler, logger as profile_logger
+from .assets import STATIC_DIR, ASSETS_URL, build_bundle, publish_assets, publish_content
+from .utils import env_truthy, compile_exclude_patterns, is_excluded, RecentlyUpdatedIndex, load_git_dates, build_file_dates, find_git_dirs, read_git_head_state, scan_file_stats, MarkdownAnalysisCache, DEFAULT_WPM, DEFAULT_WPM_CJK
 
 logger = logging.getLogger("mkdocs.plugins.document_dates")
 logger.setLevel(logging.WARNING)  # DEBUG, INFO, WARNING, ERROR, CRITICAL
 
 
+@lru_cache(maxsize=None)
+def email_hash(email) -> str:
+    # Gravatar 风格的邮箱哈希，构建时每个邮箱只计算一次，浏览器端无需再加载 md5.min.js
+    if not email:
+        return ''
+    return hashlib.md5(str(email).strip().lower().encode('utf-8')).hexdigest()
+
+
 class Author:
+    __slots__ = ('name', 'email', 'avatar', 'url', 'description')
+
     def __init__(self, name="", email="", avatar="", url="", description="", **kwargs):
         self.name = name
         self.email = email
@@ -24,6 +42,159 @@ class Author:
         self.url = url
         self.description = description
 
+    @property
+    def email_hash(self):
+        return email_hash(self.email)
+
+    def with_avatar(self, avatar):
+        return Author(self.name, self.email, avatar, self.url, self.description)
+
+
+class AuthorRegistry:
+    """
+    站点级作者表，每次构建只创建一次 Author 对象
+        - authors_yml: authors.yml 中的作者，本地头像按页面目录修复为相对地址并缓存
+        - 其余作者（git、meta、site_author）按 (name, email) 驻留
+        - 每个页面的作者解析结果按 (作者, 页面目录) 缓存为元组
+    """
+
+    def __init__(self):
+        self.authors_yml = {}
+        self._plain = {}
+        self._repaired = {}
+        self._resolved = {}
+
+    def load_yaml(self, file_path: Path):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+        for key, info in (data or {}).get('authors', {}).items():
+            self.authors_yml[key] = Author(**info)
+
+    def resolve(self, people, page_url: str):
+        """people: ((name, email), ...)，返回 Author 元组"""
+        # 相对地址只与页面所在目录有关，同一目录下的页面共享结果
+        page_dir = (page_url or '')[:(page_url or '').rfind('/') + 1]
+        key = (people, page_dir)
+        authors = self._resolved.get(key)
+        if authors is None:
+            authors = self._resolved[key] = tuple(self._lookup(name, email, page_dir) for name, email in people)
+        return authors
+
+    def _lookup(self, name, email, page_dir: str) -> Author:
+        full_author = self.authors_yml.get(name)
+        if full_author:
+            return self._repair_avatar(name, full_author, page_dir)
+        key = (name, email)
+        author = self._plain.get(key)
+        if author is None:
+            author = self._plain[key] = Author(name=str(name), email=email)
+        return author
+
+    def _repair_avatar(self, key, author: Author, page_dir: str) -> Author:
+        cache_key = (key, page_dir)
+        repaired = self._repaired.get(cache_key)
+        if repaired is not None:
+            return repaired
+        repaired = author
+        try:
+            if author.avatar:
+                parsed = urlparse(author.avatar)
+                if not parsed.scheme and not author.avatar.startswith('//'):
+                    # 处理本地路径（相对路径 & 绝对路径）
+                    repaired = author.with_avatar(get_relative_url(author.avatar.lstrip('/'), page_dir))
+        except Exception:
+            pass
+        self._repaired[cache_key] = repaired
+        return repaired
+
+
+# 只包含这些字段的格式与时分秒无关，可按日期缓存格式化结果
+DATE_ONLY_FIELDS = set('GyYuUrQqMLlwWdDFgEec')
+
+
+class DateFormatter:
+    """预先解析好 Locale 和格式模式的日期格式化器，并缓存已格式化的结果（有界 LRU）"""
+
+    def __init__(self, locale, pattern, maxsize=1024):
+        self.locale = Locale.parse(locale or LC_TIME)
+        self.pattern = parse_pattern(pattern)
+        self.date_only = all(
+            value[0] in DATE_ONLY_FIELDS
+            for kind, value in tokenize_pattern(pattern)
+            if kind == 'field'
+        )
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+
+    def __call__(self, date: datetime) -> str:
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        key = date.date() if self.date_only else (date, date.tzinfo)
+        cache = self._cache
+        value = cache.get(key)
+        if value is None:
+            value = self.pattern.apply(date, self.locale)
+            cache[key] = value
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return value
+
+
+@lru_cache(maxsize=None)
+def get_date_formatter(locale, date_type, date_format, time_format) -> DateFormatter:
+    # 兼容旧 strftime 配置，转换为 Babel/ICU 格式
+    date_format = (
+        date_format
+        .replace('%Y', 'yyyy')
+        .replace('%y', 'yy')
+        .replace('%m', 'MM')
+        .replace('%d', 'dd')
+        .replace('%B', 'MMMM')
+        .replace('%b', 'MMM')
+    )
+
+    time_format = (
+        time_format
+        .replace('%H', 'HH')
+        .replace('%I', 'hh')
+        .replace('%M', 'mm')
+        .replace('%S', 'ss')
+        .replace('%p', 'a')
+    )
+
+    if date_type == 'datetime':
+        fmt = f"{date_format} {time_format}"
+    else:
+        fmt = date_format
+
+    return DateFormatter(locale, fmt)
+
+
+# 预编译的 HTML 片段模板
+DATE_ITEM_HTML = (
+    "<span class='dd-item' data-tippy-content data-tippy-raw='{formatted}'>"
+    "<span class='material-icons' data-icon='{icon}'></span>"
+    "<time datetime='{iso}'>{formatted}</time>"
+    "</span>"
+).format
+AUTHOR_TEXT_HTML = "<span class='text-wrapper' data-tippy-content data-tippy-raw='{tooltip}'>{tooltip}</span>".format
+AUTHOR_AVATAR_HTML = (
+    "<div class='avatar-wrapper' data-name='{name}' data-tippy-content data-tippy-raw='{tooltip}'>"
+    "<span class='avatar-text'></span>"
+    "<img class='avatar' data-src='{avatar}' data-email-hash='{email_hash}' />"
+    "</div>"
+).format
+
+# 最近更新列表的插入标记：默认列表与命名列表
+RECENT_MARKER_PREFIX = '<!-- RECENTLY_UPDATED_DOCS'
+RECENT_MARKER = '\n<!-- RECENTLY_UPDATED_DOCS -->'
+RECENT_MARKER_NAMED = '\n<!-- RECENTLY_UPDATED_DOCS:{name} -->'
+
+# 用户自行加载的 Google Fonts Material Icons（不含 Outlined、Round 等变体）
+MATERIAL_ICONS_RE = re.compile(r"family=Material\+Icons(?:[&:]|$)")
+
 
 class DocumentDatesPlugin(BasePlugin):
     config_scheme = (
@@ -40,6 +211,11 @@ class DocumentDatesPlugin(BasePlugin):
         ('show_author', config_options.Choice((True, False, 'text'), default=True)),
         ('readtime_wpm', config_options.Type(int, default=DEFAULT_WPM)),
         ('readtime_wpm_cjk', config_options.Type(int, default=DEFAULT_WPM_CJK)),
+        ('cache_dir', config_options.Type(str, default='.cache/document-dates')),
+        ('dates_index', config_options.Type(str, default='')),
+        ('profile', config_options.Type(bool, default=False)),
+        ('bundle_assets', config_options.Type(bool, default=False)),
+        ('hardlink_assets', config_options.Type(bool, default=False)),
         ('recently-updated', config_options.Type((dict, bool), default={}))
     )
 
@@ -47,13 +223,49 @@ class DocumentDatesPlugin(BasePlugin):
         super().__init__()
 
         self.data_cached = {}
-        self.authors_yml = {}
-        self.recent_docs_html = None
+        self.authors = AuthorRegistry()
+        self.authors_yml = self.authors.authors_yml
+        self.recent_docs_html = {}
         self.recent_enable = False
         self._exclude_patterns = []
+        self._cache_dir = None
+        self._dates_index = None
+        self._wrapper_open = ''
+        self._author_html_cache = {}
+        self._bundles = {}
+        self._bundle_cache = {}
+        self._publish_assets = []
+        self._published_assets = {}
+
+        # 跨重新构建保留的状态（mkdocs serve）
+        self._git_dirs = None
+        self._git_state = None
+        self._git_dates = None
+        self._file_dates = {}
+        self._file_stats = {}
+        self._analysis_cache = None
+        self._md5_usage = {}
+
+    def on_startup(self, *, command, dirty):
+        # 定义 on_startup 后，mkdocs serve 重新构建时会复用同一个插件实例，从而保留已计算的数据
+        # 插件配置此时已加载，在 on_config 的统计装饰器执行前决定是否开启统计
+        self._update_profiler()
+
+    def _update_profiler(self):
+        # 耗时与内存统计（配置项 profile 或环境变量 MKDOCS_DOCUMENT_DATES_PROFILE）
+        if self.config['profile'] or env_truthy("MKDOCS_DOCUMENT_DATES_PROFILE"):
+            profiler.enable()
+        else:
+            profiler.disable()
 
+    @profiler.hook
     def on_config(self, config):
+        # mkdocs serve 重新构建时会重新加载配置，profile 可能已变化
+        self._update_profiler()
+
         docs_dir_path = Path(config.docs_dir)
+        self.authors = AuthorRegistry()
+        self.authors_yml = self.authors.authors_yml
 
         # 加载 author 配置
         authors_file = None
@@ -74,14 +286,21 @@ class DocumentDatesPlugin(BasePlugin):
         if authors_file:
             self._load_authors_from_yaml(authors_file)
 
+        # 按顺序收集插件资源: (url, 源文件路径, 相对于 assets/document_dates/ 的目录)
+        css_assets = []
+        js_assets = []
+
         # 添加离线 Google Fonts Icons, https://fonts.google.com/icons
         # material_icons_url = 'https://fonts.googleapis.com/icon?family=Material+Icons'
-        material_icons_url = 'assets/document_dates/fonts/material-icons.css'
-        config['extra_css'].append(material_icons_url)
+        # 用户已自行加载 Material Icons 时不再重复添加（连同字体文件）
+        has_material_icons = any(MATERIAL_ICONS_RE.search(str(item)) for item in config['extra_css'])
+        if not has_material_icons:
+            css_assets.append(self._static_asset('fonts', 'material-icons.css'))
 
         # 添加 timeago.js
         # https://cdn.jsdelivr.net/npm/timeago.js@4.0.2/dist/timeago.min.js
         # https://cdnjs.cloudflare.com/ajax/libs/timeago.js/4.0.2/timeago.full.min.js
+        timeago_asset = None
         if self.config['type'] == 'timeago':
             scripts = config.get('extra_javascript') or []
             has_timeago = any(
@@ -89,7 +308,7 @@ class DocumentDatesPlugin(BasePlugin):
                 for item in scripts
             )
             if not has_timeago:
-                scripts.insert(0, 'assets/document_dates/core/timeago.min.js')
+                timeago_asset = self._static_asset('core', 'timeago.min.js')
             config['extra_javascript'] = scripts
 
         """
@@ -108,9 +327,9 @@ class DocumentDatesPlugin(BasePlugin):
             https://unpkg.com/tippy.js@6/themes/material.css
         """
         # 添加 Tippy CSS 文件
-        tippy_css_dir = Path(__file__).parent / 'static' / 'tippy'
+        tippy_css_dir = STATIC_DIR / 'tippy'
         for css_file in tippy_css_dir.glob('*.css'):
-            config['extra_css'].append(f'assets/document_dates/tippy/{css_file.name}')
+            css_assets.append(self._static_asset('tippy', css_file.name))
 
         # User override config
         override_dir = docs_dir_path / 'assets' / 'document_dates'
@@ -118,43 +337,138 @@ class DocumentDatesPlugin(BasePlugin):
         override_js = override_dir / 'config.js'
 
         # Plugin CSS
-        config['extra_css'].append('assets/document_dates/core/core.css')
+        css_assets.append(self._static_asset('core', 'core.css'))
 
         # 用户 override CSS（可选）
         if override_css.exists():
-            config['extra_css'].append('assets/document_dates/config.css')
+            css_assets.append((f'{ASSETS_URL}/config.css', override_css, ''))
 
         # 按顺序添加 Tippy JS 文件
         js_core_files = ['popper.min.js', 'tippy.umd.min.js']
         for js_file in js_core_files:
-            config['extra_javascript'].append(f'assets/document_dates/tippy/{js_file}')
+            js_assets.append(self._static_asset('tippy', js_file))
 
-        # Plugin JS
-        config['extra_javascript'].extend([
-            'assets/document_dates/core/md5.min.js',
-            'assets/document_dates/core/default.config.js',
-        ])
+        # Plugin JS（头像邮箱哈希已在构建时计算，md5.min.js 只在主题覆盖模板或用户配置仍需要时加载）
+        if self._needs_md5(config, override_js):
+            js_assets.append(self._static_asset('core', 'md5.min.js'))
+        js_assets.append(self._static_asset('core', 'default.config.js'))
 
         # 用户 override JS（可选）
         if override_js.exists():
-            config['extra_javascript'].append('assets/document_dates/config.js')
+            js_assets.append((f'{ASSETS_URL}/config.js', override_js, ''))
 
         # core runtime
-        config['extra_javascript'].extend([
-            'assets/document_dates/core/utils.js',
-            'assets/document_dates/core/core.js'
-        ])
+        js_assets.append(self._static_asset('core', 'utils.js'))
+        js_assets.append(self._static_asset('core', 'core.js'))
+
+        self._bundles = {}
+        if self.config['bundle_assets']:
+            # 合并为一个样式表和一个脚本（timeago 放在最前面）
+            if timeago_asset:
+                js_assets.insert(0, timeago_asset)
+            config['extra_css'].append(self._add_bundle(css_assets, 'css'))
+            config['extra_javascript'].append(self._add_bundle(js_assets, 'js'))
+        else:
+            config['extra_css'].extend(url for url, _, _ in css_assets)
+            if timeago_asset:
+                config['extra_javascript'].insert(0, timeago_asset[0])
+            config['extra_javascript'].extend(url for url, _, _ in js_assets)
+
+        # 记录实际引用的静态文件，on_post_build 只发布这些文件
+        self._publish_assets = self._collect_publish_assets(config, css_assets, js_assets, timeago_asset)
 
         self._exclude_patterns = compile_exclude_patterns(self.config['exclude'])
 
+        # 插件骨架 HTML 的静态部分只构建一次
+        position_class = 'document-dates-top' if self.config['position'] == 'top' else 'document-dates-bottom'
+        self._wrapper_open = (
+            f"<div class='document-dates-plugin-wrapper {position_class}'>"
+            f"<div class='document-dates-plugin' locale='{self.config['locale']}'>"
+        )
+        self._author_html_cache = {}
+
+        # 持久化缓存目录（相对于配置文件所在目录），为空则禁用
+        cache_dir = self.config['cache_dir']
+        self._cache_dir = Path(config.config_file_path or '').parent / cache_dir if cache_dir else None
+
+        # 预先导出的日期索引（相对于配置文件所在目录），指定后不再调用 git 读取历史
+        dates_index = self.config['dates_index']
+        self._dates_index = Path(config.config_file_path or '').parent / dates_index if dates_index else None
+
+        # 摘要、阅读时间缓存只加载一次
+        analysis_cache_file = self._cache_dir / 'analysis_cache.json' if self._cache_dir else None
+        if self._analysis_cache is None or self._analysis_cache.cache_file != analysis_cache_file:
+            self._analysis_cache = MarkdownAnalysisCache(analysis_cache_file)
+
         return config
 
     @event_priority(50)
+    @profiler.hook
     def on_files(self, files, config):
-        self.data_cached = load_dates_and_authors(Path(config.docs_dir), files)
+        docs_dir_path = Path(config.docs_dir)
+
+        # 只有 HEAD（或其指向的引用）移动、jsonl 缓存或日期索引变化时，才重新读取 git 数据
+        dates_index_mtime = self._dates_index.stat().st_mtime_ns if self._dates_index and self._dates_index.exists() else None
+        if dates_index_mtime is not None:
+            git_head_state = None
+        else:
+            if not self._git_dirs or self._git_dirs[0] != docs_dir_path:
+                self._git_dirs = (docs_dir_path, find_git_dirs(docs_dir_path))
+            git_head_state = read_git_head_state(self._git_dirs[1])
+        jsonl_cache_file = docs_dir_path / '.dates_cache.jsonl'
+        git_state = (
+            git_head_state,
+            jsonl_cache_file.stat().st_mtime_ns if jsonl_cache_file.exists() else None,
+            self._cache_dir,
+            self._dates_index,
+            dates_index_mtime,
+        )
+        if self._git_dates is None or git_state != self._git_state:
+            self._git_dates = load_git_dates(docs_dir_path, self._cache_dir, self._dates_index)
+            self._git_state = git_state
+            self._file_dates = {}
+
+        created_data, updated_data = self._git_dates
+        self.data_cached = dict(created_data)
+
+        # 单次遍历 docs 目录获取所有文件的 mtime 和创建时间，只重新计算 mtime 发生变化的文件
+        self._file_stats = scan_file_stats(docs_dir_path)
+        file_dates = {}
+        with profiler.phase('dates:per-file'):
+            self._refresh_file_dates(files, created_data, updated_data, file_dates)
+
+        self._file_dates = file_dates
         return files
 
+    def _refresh_file_dates(self, files, created_data, updated_data, file_dates):
+        for file in files:
+            if file.inclusion.is_excluded():
+                continue
+            if not file.src_path.endswith('.md'):
+                continue
+            rel_path = getattr(file, 'src_uri')
+            file_stat = self._file_stats.get(file.abs_src_path)
+            if file_stat is not None:
+                mtime = file_stat[0]
+            else:
+                # 不在 docs 目录下的文件（如其它插件生成的文件）
+                try:
+                    mtime = os.stat(file.abs_src_path).st_mtime_ns
+                except (OSError, TypeError):
+                    mtime = None
+
+            cached = self._file_dates.get(rel_path)
+            if cached and cached[0] == mtime:
+                entry = cached[1]
+            else:
+                entry = build_file_dates(created_data.get(rel_path, {}), updated_data.get(rel_path), file.abs_src_path, file_stat)
+            file_dates[rel_path] = (mtime, entry)
+
+            # on_page_markdown 会写入 meta 中的日期，因此存储副本
+            self.data_cached[rel_path] = dict(entry)
+
     @event_priority(50)
+    @profiler.hook
     def on_page_markdown(self, markdown, page: Page, config, files):
         # 获取相对路径，src_uri 总是以"/"分隔
         rel_path = getattr(page.file, 'src_uri')
@@ -203,10 +517,10 @@ class DocumentDatesPlugin(BasePlugin):
         return self._insert_date_info(markdown, info_html)
 
     @event_priority(50)
+    @profiler.hook
     def on_env(self, env, config, files):
         recently_updated_config = self.config.get('recently-updated')
-        if recently_updated_config:
-            self.recent_enable = True
+        self.recent_enable = bool(recently_updated_config)
 
         # 兼容 true 配置
         if recently_updated_config is True:
@@ -215,6 +529,7 @@ class DocumentDatesPlugin(BasePlugin):
         # 获取配置
         exclude_list = recently_updated_config.get('exclude', [])
         limit = recently_updated_config.get('limit', 10)
+        summary = recently_updated_config.get("summary_lines", {})
 
         # 获取站点 URL 路径前缀
         site_url = config.get("site_url") or ""
@@ -225,57 +540,173 @@ class DocumentDatesPlugin(BasePlugin):
         wpm = self.config.get('readtime_wpm', DEFAULT_WPM)
         wpm_cjk = self.config.get('readtime_wpm_cjk', DEFAULT_WPM_CJK)
 
-        # 获取最近更新的文档数据
-        recent_exclude_patterns = compile_exclude_patterns(exclude_list)
-        recently_updated_docs = get_recently_updated_files(self.data_cached, files, recent_exclude_patterns, limit, self.recent_enable, prefix, wpm, wpm_cjk)
+        # 获取最近更新的文档数据：默认列表和命名列表都从同一个排序索引中查询
+        recent_lists = {}
+        if self.recent_enable:
+            index = RecentlyUpdatedIndex(self.data_cached, files, prefix, wpm, wpm_cjk, self._analysis_cache, self._file_stats)
+            recent_lists[None] = (index.query(exclude_list=compile_exclude_patterns(exclude_list), limit=limit), summary)
+
+            # 命名列表，未指定的 limit、exclude、summary_lines 沿用顶层配置
+            for name, list_config in (recently_updated_config.get('lists') or {}).items():
+                list_config = list_config or {}
+                docs = index.query(
+                    paths=self._as_list(list_config.get('paths')),
+                    tags=self._as_list(list_config.get('tags')),
+                    exclude_list=compile_exclude_patterns(list_config.get('exclude', exclude_list)),
+                    limit=list_config.get('limit', limit),
+                )
+                recent_lists[str(name)] = (docs, list_config.get('summary_lines', summary))
+
+        recently_updated_docs = recent_lists[None][0] if self.recent_enable else []
 
         # 将数据注入到 config['extra'] 中供全局访问
         if not config.get('extra', {}).get("recently_updated_docs", {}):
             config['extra']['recently_updated_docs'] = recently_updated_docs
-
-        # 渲染HTML
-        if self.recent_enable:
-            # 摘要行数的动态配置
-            summary = recently_updated_config.get("summary_lines", {})
-            summary_lines = {
-                "grid": summary.get("grid", 4),
-                "detail": summary.get("detail", 6),
+        if not config.get('extra', {}).get("recently_updated_lists", {}):
+            config['extra']['recently_updated_lists'] = {
+                name: docs for name, (docs, _) in recent_lists.items() if name is not None
             }
 
-            self.recent_docs_html = self._render_recently_updated_html(env, config, recently_updated_docs, summary_lines)
+        # 渲染HTML，每个列表只渲染一次，on_post_page 中按各自的标记替换
+        self.recent_docs_html = {}
+        if self.recent_enable:
+            with profiler.phase('recently_updated:render'):
+                template = self._get_recently_updated_template(env)
+                for name, (docs, summary_lines) in recent_lists.items():
+                    marker = RECENT_MARKER if name is None else RECENT_MARKER_NAMED.format(name=name)
+                    # 摘要行数的动态配置
+                    summary_lines = {
+                        "grid": summary_lines.get("grid", 4),
+                        "detail": summary_lines.get("detail", 6),
+                    }
+                    self.recent_docs_html[marker] = template.render(
+                        recent_docs=docs,
+                        summary_lines=summary_lines,
+                        config=config
+                    )
 
         return env
 
     @event_priority(50)
+    @profiler.hook
     def on_post_page(self, output, page, config):
-        if self.recent_enable and '\n<!-- RECENTLY_UPDATED_DOCS -->' in output:
-            output = output.replace('\n<!-- RECENTLY_UPDATED_DOCS -->', self.recent_docs_html or '')
+        if self.recent_enable and RECENT_MARKER_PREFIX in output:
+            for marker, html in self.recent_docs_html.items():
+                if marker in output:
+                    output = output.replace(marker, html)
 
         return output
 
     def on_post_build(self, config):
-        site_dest_dir = Path(config['site_dir']) / 'assets' / 'document_dates'
-        for dir_name in ['tippy', 'core', 'fonts']:
-            source_dir = Path(__file__).parent / 'static' / dir_name
-            target_dir = site_dest_dir / dir_name
-            # shutil.copytree(source_dir, target_dir, dirs_exist_ok=True)
-            target_dir.mkdir(parents=True, exist_ok=True)
-            for item in source_dir.iterdir():
-                if item.is_file():
-                    shutil.copy2(item, target_dir / item.name)
+        with profiler.phase('hook:on_post_build'):
+            if self._analysis_cache:
+                self._analysis_cache.save()
+
+            # 只发布当前配置引用的文件，目标已是最新时跳过（mkdocs serve 重新构建时基本无需 I/O）
+            site_dir = Path(config['site_dir'])
+            with profiler.phase('assets:publish'):
+                written = publish_assets(self._publish_assets, site_dir, self._published_assets)
+
+                # 写入合并后的资源文件，hardlink_assets 时从缓存目录中的副本硬链接（绝不链接安装包中的源文件）
+                site_dest_dir = site_dir / ASSETS_URL
+                bundle_cache_dir = self._cache_dir / 'assets' if self.config['hardlink_assets'] and self._cache_dir else None
+                for file_name, content in self._bundles.items():
+                    written += publish_content(content, site_dest_dir / file_name, bundle_cache_dir)
+            profiler.count('assets:publish', written=written)
+
+        if profiler.enabled:
+            self._write_profile_report(Path(config['site_dir']))
 
 
+    def _write_profile_report(self, site_dir: Path):
+        profile_logger.info("document-dates profile:\n" + profiler.summary_table())
+        report_file = site_dir / 'document-dates-profile.json'
+        try:
+            report_file.write_text(json.dumps(profiler.report(), indent=2), encoding='utf-8')
+            profile_logger.info(f"document-dates profile report written to {report_file}")
+        except OSError as e:
+            logger.warning(f"Failed to write profile report {report_file}: {e}")
+        profiler.reset()
+
+
+    def _static_asset(self, dir_name: str, file_name: str):
+        return f'{ASSETS_URL}/{dir_name}/{file_name}', STATIC_DIR / dir_name / file_name, dir_name
+
+    def _collect_publish_assets(self, config, css_assets, js_assets, timeago_asset):
+        # 返回 [(源文件路径, 站点内相对路径)]，用户 override 文件由 mkdocs 自身从 docs 目录复制
+        static_assets = css_assets + js_assets + ([timeago_asset] if timeago_asset else [])
+        if self.config['bundle_assets']:
+            urls = []
+        else:
+            urls = [url for url, _, base in static_assets if base]
+        # 合并模式下字体仍被 CSS 以相对路径引用
+        if any(url.endswith('material-icons.css') for url, _, base in static_assets if base):
+            urls.append(f'{ASSETS_URL}/fonts/materialicons.woff2')
+
+        # 用户在 extra_css / extra_javascript 中直接引用的插件文件，如 core/timeago.full.min.js
+        docs_dir = Path(config['docs_dir'])
+        for item in list(config['extra_css']) + list(config['extra_javascript']):
+            url = str(item)
+            if url.startswith(f'{ASSETS_URL}/') and url not in urls and not (docs_dir / url).exists():
+                urls.append(url)
+
+        publish = []
+        for url in urls:
+            source = STATIC_DIR / url[len(ASSETS_URL) + 1:]
+            if source.is_file():
+                publish.append((source, url))
+        return publish
+
+    def _add_bundle(self, assets, kind: str):
+        # 同一组源文件（及其 mtime）只合并一次，mkdocs serve 重新构建时直接复用
+        key = tuple((str(path), path.stat().st_mtime_ns) for _, path, _ in assets)
+        bundle = self._bundle_cache.get(key)
+        if bundle is None:
+            bundle = self._bundle_cache[key] = build_bundle([(path, base) for _, path, base in assets], kind)
+        file_name, content = bundle
+        self._bundles[file_name] = content
+        return f'{ASSETS_URL}/{file_name}'
+
+    def _needs_md5(self, config, override_js: Path):
+        # 主题覆盖模板仍使用 data-email，或用户 JS 调用了 md5()
+        candidates = []
+        custom_dir = getattr(config.theme, 'custom_dir', None)
+        if custom_dir and Path(custom_dir).is_dir():
+            candidates.extend(Path(custom_dir).rglob('*.html'))
+        if override_js.exists():
+            candidates.append(override_js)
+        # 按 (mtime, 大小) 缓存每个文件的检测结果，mkdocs serve 重新构建时只读取变化的文件
+        needs = False
+        for candidate in candidates:
+            try:
+                stat = candidate.stat()
+            except OSError:
+                continue
+            key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._md5_usage.get(candidate)
+            if cached is None or cached[0] != key:
+                try:
+                    content = candidate.read_text(encoding='utf-8')
+                    cached = self._md5_usage[candidate] = (key, 'data-email=' in content or 'md5(' in content)
+                except (OSError, UnicodeDecodeError):
+                    continue
+            needs = needs or cached[1]
+        return needs
+
     def _load_authors_from_yaml(self, file_path: Path):
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            for key, info in (data or {}).get('authors', {}).items():
-                self.authors_yml[key] = Author(**info)
+            self.authors.load_yaml(file_path)
         except Exception as e:
             logger.info(f"Error parsing .authors.yml: {e}")
 
 
-    def _render_recently_updated_html(self, env, config, recently_updated_data, summary_lines):
+    @staticmethod
+    def _as_list(value):
+        if value is None:
+            return []
+        return value if isinstance(value, list) else [value]
+
+    def _get_recently_updated_template(self, env):
         # 设置模板加载器
         template_path = Path(__file__).parent / 'static' / 'templates'
         env.loader = ChoiceLoader([
@@ -290,13 +721,7 @@ class DocumentDatesPlugin(BasePlugin):
         except Exception:
             env.globals["HAS_LANGUAGE_TEMPLATE"] = False
 
-        # 获取模板并渲染
-        template = env.get_template("recently_updated_group.html")
-        return template.render(
-            recent_docs=recently_updated_data,
-            summary_lines=summary_lines,
-            config=config
-        )
+        return env.get_template("recently_updated_group.html")
 
 
     def _load_meta_date(self, meta, field_names):
@@ -320,36 +745,19 @@ class DocumentDatesPlugin(BasePlugin):
         # 1. git author
         authors_list = self.data_cached.get(rel_path, {}).get('authors', None)
         if authors_list:
-            authors = []
-            for data in authors_list:
-                full_author = self.authors_yml.get(data['name'])
-                if full_author:
-                    authors.append(self._repair_author(full_author, page.url))
-                else:
-                    authors.append(Author(**data))
-            return authors
+            people = tuple((data['name'], data.get('email', '')) for data in authors_list)
+            return self.authors.resolve(people, page.url)
 
         # 2. site_author 或 PC username
         name = config.get('site_author') or Path.home().name
-        full_author = self.authors_yml.get(name)
-        if full_author:
-            return [self._repair_author(full_author, page.url)]
-        else:
-            return [Author(name=name)]
+        return self.authors.resolve(((name, ''),), page.url)
 
     def _load_meta_author(self, meta, page_url):
         try:
             # 匹配 authors 数组
-            author_objs = []
             authors_data = meta.get('authors')
-            for key in authors_data or []:
-                full_author = self.authors_yml.get(key)
-                if full_author:
-                    author_objs.append(self._repair_author(full_author, page_url))
-                else:
-                    author_objs.append(Author(name=str(key)))
-            if author_objs:
-                return author_objs
+            if authors_data:
+                return self.authors.resolve(tuple((key, '') for key in authors_data), page_url)
 
             # 匹配独立字段: name, email
             name = meta.get('name')
@@ -357,62 +765,22 @@ class DocumentDatesPlugin(BasePlugin):
             if name or email:
                 if not name and email:
                     name = email.partition('@')[0]
-                full_author = self.authors_yml.get(name)
-                if full_author:
-                    return [self._repair_author(full_author, page_url)]
-                else:
-                    return [Author(name=name, email=email)]
+                return self.authors.resolve(((name, email),), page_url)
         except Exception as e:
             logger.warning(f"Error processing author meta: {e}")
         return None
 
-    def _repair_author(self, author: Author, page_url: str) -> Author:
-        try:
-            if not author.avatar:
-                return author
-            parsed = urlparse(author.avatar)
-            if parsed.scheme or author.avatar.startswith('//'):
-                return author
-            # 处理本地路径（相对路径 & 绝对路径）
-            avatar = get_relative_url(author.avatar.lstrip('/'), page_url or '')
-            return Author(**{**vars(author), 'avatar': avatar})
-        except Exception:
-            return author
-
 
     def _formatting_date(self, date: datetime):
-        locale = self.config.get('locale', 'en')
-
-        # 兼容旧 strftime 配置，转换为 Babel/ICU 格式
-        date_format = (
-            self.config['date_format']
-            .replace('%Y', 'yyyy')
-            .replace('%y', 'yy')
-            .replace('%m', 'MM')
-            .replace('%d', 'dd')
-            .replace('%B', 'MMMM')
-            .replace('%b', 'MMM')
-        )
-
-        time_format = (
-            self.config['time_format']
-            .replace('%H', 'HH')
-            .replace('%I', 'hh')
-            .replace('%M', 'mm')
-            .replace('%S', 'ss')
-            .replace('%p', 'a')
-        )
-
-        if self.config['type'] == 'datetime':
-            fmt = f"{date_format} {time_format}"
-        else:
-            fmt = date_format
-
-        return format_datetime(
-            date,
-            format=fmt,
-            locale=locale
+        # 每组 (locale, type, date_format, time_format) 只构建一次格式化器
+        formatter = get_date_formatter(
+            self.config.get('locale', 'en'),
+            self.config['type'],
+            self.config['date_format'],
+            self.config['time_format'],
         )
+        with profiler.phase('dates:format'):
+            return formatter(date)
 
     def _generate_html_info(self, meta, created: datetime, updated: datetime, authors=None):
         try:
@@ -425,67 +793,21 @@ class DocumentDatesPlugin(BasePlugin):
             if not show_plugin:
                 return ""
 
-            # 构建插件骨架 HTML
-            html_parts = []
-            position_class = 'document-dates-top' if self.config['position'] == 'top' else 'document-dates-bottom'
-            html_parts.append(f"<div class='document-dates-plugin-wrapper {position_class}'>")
-            html_parts.append(f"<div class='document-dates-plugin' locale='{self.config['locale']}'>")
-
-            def build_time_icon(time_obj: datetime, icon: str):
-                formatted = self._formatting_date(time_obj)
-                return (
-                    f"<span class='dd-item' data-tippy-content data-tippy-raw='{formatted}'>"
-                    f"<span class='material-icons' data-icon='{icon}'></span>"
-                    f"<time datetime='{time_obj.astimezone().isoformat()}'>{formatted}</time>"
-                    f"</span>"
-                )
+            html_parts = [self._wrapper_open]
 
-            # 构建日期
+            # 构建日期（每页只需格式化日期）
             if show_dates:
                 html_parts.append("<div class='dd-left'>")
-            if show_created:
-                html_parts.append(build_time_icon(created, 'doc_created'))
-            if show_updated:
-                html_parts.append(build_time_icon(updated, 'doc_updated'))
-            if show_dates:
+                if show_created:
+                    html_parts.append(self._build_date_item(created, 'doc_created'))
+                if show_updated:
+                    html_parts.append(self._build_date_item(updated, 'doc_updated'))
                 html_parts.append("</div>")
 
             # 构建作者
             if show_author and authors:
-                def get_author_tooltip(author):
-                    if author.url:
-                        return f'<a href="{author.url}" target="_blank">{author.name}</a>'
-                    elif author.email:
-                        return f'<a href="mailto:{author.email}">{author.name}</a>'
-                    return author.name
-
-                if show_dates:
-                    html_parts.append("<div class='dd-right'>")
-                else:
-                    html_parts.append("<div class='dd-right dd-right-start'>")
-                icon = 'doc_author' if len(authors) == 1 else 'doc_authors'
-                html_parts.append(f"<span class='material-icons' data-icon='{icon}'></span>")
-                html_parts.append("<div class='author-group'>")
                 show_text = self.config['show_author'] == 'text' or meta.get('show_author') == 'text'
-                if show_text:
-                    # 显示文本模式
-                    for index, author in enumerate(authors):
-                        if index > 0:
-                            html_parts.append(",&nbsp;&nbsp;")
-                        tooltip = get_author_tooltip(author)
-                        html_parts.append(f"<span class='text-wrapper' data-tippy-content data-tippy-raw='{ tooltip }'>{ tooltip }</span>")
-                else:
-                    # 显示头像模式（默认）
-                    for author in authors:
-                        tooltip = get_author_tooltip(author)
-                        html_parts.append(
-                            f"<div class='avatar-wrapper' data-name='{author.name}' data-tippy-content data-tippy-raw='{tooltip}'>"
-                            f"<span class='avatar-text'></span>"
-                            f"<img class='avatar' data-src='{author.avatar}' data-email='{author.email}' />"
-                            f"</div>"
-                        )
-                html_parts.append("</div>")
-                html_parts.append("</div>")
+                html_parts.append(self._build_author_group(authors, show_text, show_dates))
 
             html_parts.append("</div></div>")
             return ''.join(html_parts)
@@ -494,6 +816,47 @@ class DocumentDatesPlugin(BasePlugin):
             logger.warning(f"Error generating HTML info: {e}")
             return ""
 
+    def _build_date_item(self, time_obj: datetime, icon: str):
+        formatted = self._formatting_date(time_obj)
+        return DATE_ITEM_HTML(formatted=formatted, icon=icon, iso=time_obj.astimezone().isoformat())
+
+    def _build_author_group(self, authors, show_text: bool, show_dates: bool):
+        # 作者对象由 AuthorRegistry 驻留，头像已按页面目录修复，可直接以对象元组为键
+        key = (tuple(authors), show_text, show_dates)
+        html = self._author_html_cache.get(key)
+        if html is not None:
+            return html
+
+        def get_author_tooltip(author):
+            if author.url:
+                return f'<a href="{author.url}" target="_blank">{author.name}</a>'
+            elif author.email:
+                return f'<a href="mailto:{author.email}">{author.name}</a>'
+            return author.name
+
+        html_parts = ["<div class='dd-right'>" if show_dates else "<div class='dd-right dd-right-start'>"]
+        icon = 'doc_author' if len(authors) == 1 else 'doc_authors'
+        html_parts.append(f"<span class='material-icons' data-icon='{icon}'></span>")
+        html_parts.append("<div class='author-group'>")
+        if show_text:
+            # 显示文本模式
+            html_parts.append(",&nbsp;&nbsp;".join(
+                AUTHOR_TEXT_HTML(tooltip=get_author_tooltip(author)) for author in authors
+            ))
+        else:
+            # 显示头像模式（默认）
+            for author in authors:
+                html_parts.append(AUTHOR_AVATAR_HTML(
+                    name=author.name,
+                    tooltip=get_author_tooltip(author),
+                    avatar=author.avatar,
+                    email_hash=author.email_hash,
+                ))
+        html_parts.append("</div></div>")
+
+        html = ''.join(html_parts)
+        self._author_html_cache[key] = html
+        return html
 
     def _insert_date_info(self, markdown: str, date_info: str):
         if not date_info:
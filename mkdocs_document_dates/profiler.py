@@ -0,0 +1,126 @@
+import time
+import logging
+import tracemalloc
+from functools import wraps
+from contextlib import contextmanager
+
+logger = logging.getLogger("mkdocs.plugins.document_dates.profile")
+logger.setLevel(logging.INFO)
+
+
+class Profiler:
+    """
+    可选的耗时与内存统计，默认关闭（关闭时每次调用只有一次属性判断）
+        - phase: 统计某个钩子或内部阶段的墙钟时间、调用次数、峰值内存（tracemalloc）
+        - count: 累加计数，如 git 子进程输出的字节数
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.stats = {}
+        self._stack = []
+        self._started_tracemalloc = False
+
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+
+    def disable(self):
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset(self):
+        self.stats = {}
+
+    def _entry(self, name):
+        entry = self.stats.get(name)
+        if entry is None:
+            entry = self.stats[name] = {'calls': 0, 'wall': 0.0, 'peak_memory': 0}
+        return entry
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        # 嵌套阶段会重置 tracemalloc 峰值，因此先把当前峰值记到外层阶段
+        current, peak = tracemalloc.get_traced_memory()
+        for frame in self._stack:
+            frame['peak'] = max(frame['peak'], peak)
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        frame = {'base': current, 'peak': current}
+        self._stack.append(frame)
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            self._stack.pop()
+            frame['peak'] = max(frame['peak'], peak)
+            for outer in self._stack:
+                outer['peak'] = max(outer['peak'], peak)
+
+            entry = self._entry(name)
+            entry['calls'] += 1
+            entry['wall'] += wall
+            entry['peak_memory'] = max(entry['peak_memory'], frame['peak'] - frame['base'])
+
+    def count(self, name, **counters):
+        if not self.enabled:
+            return
+        entry = self._entry(name)
+        for key, value in counters.items():
+            entry[key] = entry.get(key, 0) + value
+
+    def hook(self, func):
+        # 用于插件钩子的装饰器
+        name = f"hook:{func.__name__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    def report(self):
+        return {
+            name: dict(entry)
+            for name, entry in sorted(self.stats.items(), key=lambda item: item[1]['wall'], reverse=True)
+        }
+
+    def summary_table(self):
+        rows = [("phase", "calls", "wall (ms)", "peak mem (KiB)", "extra")]
+        for name, entry in self.report().items():
+            extra = ', '.join(
+                f"{key}={value}"
+                for key, value in entry.items()
+                if key not in ('calls', 'wall', 'peak_memory')
+            )
+            rows.append((
+                name,
+                str(entry['calls']),
+                f"{entry['wall'] * 1000:.1f}",
+                f"{entry['peak_memory'] / 1024:.1f}",
+                extra,
+            ))
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        lines = [
+            "  ".join(cell.ljust(widths[i]) if i == 0 else cell.rjust(widths[i]) for i, cell in enumerate(row)).rstrip()
+            for row in rows
+        ]
+        lines.insert(1, "-" * len(lines[0]))
+        return "\n".join(lines)
+
+
+profiler = Profiler()
@@ -38,12 +38,16 @@ function loadAvatars() {
             const urls = [];
             const dataSrc = (imgEl.dataset.src || '').trim();
             const email = (imgEl.dataset.email || '').trim();
+            // 邮箱哈希优先使用构建时计算的 data-email-hash，兼容仍使用 data-email 的覆盖模板
+            let hash = (imgEl.dataset.emailHash || '').trim();
+            if (!hash && email && typeof md5 === 'function') {
+                hash = md5(email.toLowerCase());
+            }
 
             if (dataSrc) {
                 urls.push(dataSrc);
             }
-            if (email && AvatarService.base) {
-                const hash = md5(email.trim().toLowerCase());
+            if (hash && AvatarService.base) {
                 urls.push(AvatarService.build(hash));
             }
             if (urls.length === 0) {
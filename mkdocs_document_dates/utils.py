@@ -1,17 +1,24 @@
+import io
 import os
+import sys
 import platform
 import json
-import heapq
+import gzip
 import logging
 import subprocess
 import fnmatch
 import re
 import math
+import time
+import hashlib
+import tempfile
+import threading
 from pathlib import Path
+from typing import Optional
 from operator import itemgetter
 from datetime import datetime, timezone
-from collections import defaultdict
 from mkdocs.structure.files import Files
+from .profiler import profiler
 
 logger = logging.getLogger("mkdocs.plugins.document_dates")
 logger.setLevel(logging.WARNING)  # DEBUG, INFO, WARNING, ERROR, CRITICAL
@@ -19,53 +26,334 @@ logger.setLevel(logging.WARNING)  # DEBUG, INFO, WARNING, ERROR, CRITICAL
 
 DEFAULT_WPM = 240
 DEFAULT_WPM_CJK = 480
+GIT_INDEX_VERSION = 2
+DATES_INDEX_VERSION = 1
+ANALYZER_VERSION = 1
+ANALYSIS_CACHE_MAX_AGE = 20
+GIT_LOG_CHUNK_SIZE = 64 * 1024
+
+def env_truthy(name: str) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return False
+    value = value.strip().lower()
+    return value not in ("", "0", "false", "no", "off")
+
+def ensure_cache_dir(cache_dir: Path):
+    # 创建缓存目录时写入只含 * 的 .gitignore，机器本地的缓存文件不会出现在 git status 中，也不会被误提交
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = cache_dir / '.gitignore'
+    if not gitignore.exists():
+        gitignore.write_text('*\n', encoding='utf-8')
+
+def load_dates_and_authors(docs_dir_path: Path, files: Files, cache_dir: Optional[Path] = None, dates_index: Optional[Path] = None):
+    created_data, updated_data = load_git_dates(docs_dir_path, cache_dir, dates_index)
+    file_stats = scan_file_stats(docs_dir_path)
+
+    for file in files:
+        if file.inclusion.is_excluded():
+            continue
+        if not file.src_path.endswith('.md'):
+            continue
+        rel_path = getattr(file, 'src_uri')
+        created_data[rel_path] = build_file_dates(
+            created_data.get(rel_path, {}), updated_data.get(rel_path), file.abs_src_path, file_stats.get(file.abs_src_path)
+        )
 
-def load_dates_and_authors(docs_dir_path: Path, files: Files):
+    return created_data
 
-    # git 创建日期
-    created_data = load_git_metadata(docs_dir_path)
+def load_git_dates(docs_dir_path: Path, cache_dir: Optional[Path] = None, dates_index: Optional[Path] = None):
+    # git 创建日期、更新日期、作者（单次遍历，指定 cache_dir 时增量更新）
+    # 指定 dates_index 时直接读取预先导出的索引文件，不调用 git（读取失败时回退到 git）
+    index = load_dates_index(dates_index) if dates_index else None
+    if index is not None:
+        history = _catch_up_dates_index(docs_dir_path, dates_index, *index)
+    else:
+        history = load_git_history(docs_dir_path, cache_dir)
+    created_data = {
+        file_path: {
+            'created': entry['created'],
+            'authors': [{'name': name, 'email': email} for name, email in entry['authors']]
+        }
+        for file_path, entry in history.items()
+    }
 
     # 覆盖 jsonl 创建日期
     jsonl_cache_file = docs_dir_path / '.dates_cache.jsonl'
     if jsonl_cache_file.exists():
-        jsonl_cache = read_jsonl_cache(jsonl_cache_file)
+        jsonl_cache = load_jsonl_cache(jsonl_cache_file, cache_dir)
         for filename, new_info in jsonl_cache.items():
             if filename in created_data:
                 created_data[filename].update(new_info)
 
-    # git 更新日期
-    updated_data = load_git_last_updated_dates(docs_dir_path)
+    # git 更新日期（只记录仍被跟踪的文件）
+    updated_data = {
+        file_path: entry['updated']
+        for file_path, entry in history.items()
+        if entry['tracked']
+    }
+    return created_data, updated_data
+
+def build_file_dates(info: dict, updated_ts, abs_src_path, file_stat=None) -> dict:
+    """
+    将 git/jsonl 中的时间戳转换为 datetime，缺失时回退到文件系统时间
+        file_stat: scan_file_stats 得到的 (mtime_ns, 创建时间戳)，没有时单独读取
+    """
+    entry = dict(info)
+
+    # created: timestamp -> datetime
+    created_ts = entry.get('created')
+    if created_ts is not None:
+        entry['created'] = datetime.fromtimestamp(created_ts, tz=timezone.utc)
+    elif file_stat is not None:
+        entry['created'] = datetime.fromtimestamp(file_stat[1], tz=timezone.utc)
+    else:
+        entry['created'] = load_file_creation_date(abs_src_path)
+
+    # updated: timestamp -> datetime
+    if updated_ts is None:
+        if file_stat is not None:
+            updated_ts = file_stat[0] / 1e9
+        else:
+            profiler.count('fs:stat', stat=1)
+            updated_ts = os.path.getmtime(abs_src_path)
+    entry['updated'] = datetime.fromtimestamp(updated_ts, tz=timezone.utc)
+    return entry
+
+
+# ===== 文件系统元数据 =====
+# 平台只判断一次
+SYSTEM = platform.system().lower()
+
+# Linux statx(2)：AT_FDCWD、STATX_TYPE | STATX_MTIME | STATX_BTIME，以及 struct statx 中的偏移
+AT_FDCWD = -100
+STATX_MASK = 0x0001 | 0x0040 | 0x0800
+STATX_BTIME = 0x0800
+STATX_BUF_SIZE = 256
+STATX_BTIME_OFFSET = 80
+STATX_MTIME_OFFSET = 112
+
+
+def _load_statx():
+    if not SYSTEM.startswith('linux'):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        func = libc.statx
+        func.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.c_char_p]
+        func.restype = ctypes.c_int
+        return func, ctypes.create_string_buffer
+    except (OSError, AttributeError, ImportError):
+        return None
+
+_statx = _load_statx()
+
+
+def statx_times(path):
+    """
+    通过 statx 一次读取 (mtime_ns, 创建时间戳)，文件系统不支持创建时间时为 None
+    不支持 statx 时返回 None
+    """
+    if _statx is None:
+        return None
+    func, create_buffer = _statx
+    buf = create_buffer(STATX_BUF_SIZE)
+    if func(AT_FDCWD, os.fsencode(path), 0, STATX_MASK, buf) != 0:
+        return None
+    raw = buf.raw
+    mask = int.from_bytes(raw[0:4], sys.byteorder)
+    mtime_ns = _statx_timestamp_ns(raw, STATX_MTIME_OFFSET)
+    if not mask & STATX_BTIME:
+        return mtime_ns, None
+    # 与 macOS 一致：修改时间被设置得更早时（如 touch -d、解压），创建时间不晚于修改时间
+    return mtime_ns, min(_statx_timestamp_ns(raw, STATX_BTIME_OFFSET), mtime_ns) / 1e9
+
+def _statx_timestamp_ns(raw: bytes, offset: int) -> int:
+    # struct statx_timestamp { __s64 tv_sec; __u32 tv_nsec; __s32 __reserved; }
+    sec = int.from_bytes(raw[offset:offset + 8], sys.byteorder, signed=True)
+    nsec = int.from_bytes(raw[offset + 8:offset + 12], sys.byteorder)
+    return sec * 1_000_000_000 + nsec
+
+def _stat_birth_time(stat):
+    # Windows 的 st_ctime 即创建时间；macOS 有 st_birthtime；其它平台没有时使用修改时间
+    birth = getattr(stat, 'st_birthtime', None)
+    if birth is not None:
+        return birth
+    if SYSTEM.startswith('win'):
+        return stat.st_ctime
+    return stat.st_mtime
+
+def _file_times(path, entry=None):
+    # 返回 (mtime_ns, 创建时间戳, 系统调用名)
+    times = statx_times(path)
+    if times is not None:
+        mtime_ns, birth = times
+        return mtime_ns, (birth if birth is not None else mtime_ns / 1e9), 'statx'
+    stat = entry.stat() if entry is not None else os.stat(path)
+    return stat.st_mtime_ns, _stat_birth_time(stat), 'stat'
+
+def scan_file_stats(docs_dir_path: Path, suffix: str = '.md') -> dict:
+    """
+    单次 os.scandir 遍历 docs 目录，读取所有 Markdown 文件的修改时间和创建时间
+    返回: {绝对路径（与 File.abs_src_path 一致）: (mtime_ns, 创建时间戳)}
+    """
+    stats = {}
+    counters = {'scandir': 0, 'stat': 0, 'statx': 0}
+    with profiler.phase('fs:scan'):
+        stack = [os.path.normpath(os.path.abspath(docs_dir_path))]
+        while stack:
+            current = stack.pop()
+            counters['scandir'] += 1
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                # 与 mkdocs 默认行为一致，跳过隐藏目录
+                                if not entry.name.startswith('.'):
+                                    stack.append(entry.path)
+                            elif entry.name.endswith(suffix) and entry.is_file():
+                                mtime_ns, birth, syscall = _file_times(entry.path, entry)
+                                counters[syscall] += 1
+                                stats[entry.path] = (mtime_ns, birth)
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.debug(f"Failed to scan directory {current}: {e}")
+    profiler.count('fs:scan', files=len(stats), **counters)
+    return stats
 
-    for file in files:
-        if file.inclusion.is_excluded():
-            continue
-        if not file.src_path.endswith('.md'):
-            continue
-        rel_path = getattr(file, 'src_uri')
+def find_git_dirs(docs_dir_path: Path):
+    # 返回 (git_dir, common_dir)，worktree 中分支引用保存在 common_dir 下
+    try:
+        git_dir, common_dir = subprocess.check_output(
+            ['git', 'rev-parse', '--absolute-git-dir', '--git-common-dir'],
+            cwd=docs_dir_path, encoding='utf-8', stderr=subprocess.DEVNULL
+        ).splitlines()
+        return Path(git_dir), (docs_dir_path / common_dir).resolve()
+    except Exception:
+        return None
+
+def read_git_head_state(git_dirs):
+    # 直接读取 .git/HEAD 及其指向的引用，无需启动 git 子进程，用于判断 HEAD 是否移动
+    # 无法解析时（如 reftable 格式的仓库）回退到 git rev-parse HEAD
+    if not git_dirs:
+        return None
+    git_dir, common_dir = git_dirs
+    try:
+        head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+        if not head.startswith('ref:'):
+            return (head,)
+        ref = head[4:].strip()
+        for base in (git_dir, common_dir):
+            ref_file = base / ref
+            if ref_file.is_file():
+                return head, ref_file.read_text(encoding='utf-8').strip()
+        packed_refs = os.stat(common_dir / 'packed-refs')
+        return head, packed_refs.st_mtime_ns, packed_refs.st_size
+    except OSError:
+        pass
 
-        # created: timestamp -> datetime
-        cache = created_data.setdefault(rel_path, {})
-        created_ts = cache.get('created')
-        cache['created'] = (
-            datetime.fromtimestamp(created_ts, tz=timezone.utc)
-            if created_ts is not None
-            else load_file_creation_date(file.abs_src_path)
-        )
+    try:
+        return ('rev-parse', subprocess.check_output(
+            ['git', '--git-dir', str(git_dir), 'rev-parse', 'HEAD'],
+            encoding='utf-8', stderr=subprocess.DEVNULL
+        ).strip())
+    except Exception:
+        # 状态未知：返回一个与任何值都不相等的对象，调用方会重新读取 git 数据
+        return object()
+
+GLOB_CHARS = set('*?[')
+_exclude_matchers = {}
+
+
+class ExcludeMatcher:
+    """
+    编译后的排除规则（fnmatch 语义，* 可匹配 /）
+        - 纯目录前缀规则（如 api/*、generated/**）放入前缀树，按路径的目录层级逐级查找
+        - 其余规则合并为一个多选分支正则
+        - 结果只取决于规则和路径，因此按路径缓存
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self._trie = {}
+        self._memo = {}
+
+        rest = []
+        for pattern in self.patterns:
+            prefix = self._dir_prefix(pattern)
+            if prefix:
+                node = self._trie
+                for part in prefix:
+                    node = node.setdefault(part, {})
+                node[None] = True
+            else:
+                rest.append(pattern)
 
-        # updated: timestamp -> datetime
-        mtime = updated_data.get(rel_path, os.path.getmtime(file.abs_src_path))
-        created_data[rel_path]['updated'] = datetime.fromtimestamp(mtime, tz=timezone.utc)
+        self._regex = None
+        self._regexes = None
+        if rest:
+            try:
+                self._regex = re.compile('|'.join(f"(?:{fnmatch.translate(pattern)})" for pattern in rest))
+            except re.error:
+                self._regexes = [re.compile(fnmatch.translate(pattern)) for pattern in rest]
+
+    @staticmethod
+    def _dir_prefix(pattern: str):
+        # 'a/b/*' 或 'a/b/**' -> ['a', 'b']，前缀部分不能包含通配符
+        for suffix in ('/**', '/*'):
+            if pattern.endswith(suffix):
+                head = pattern[:-len(suffix)]
+                if head and not GLOB_CHARS.intersection(head) and not head.startswith('/'):
+                    parts = head.split('/')
+                    if all(parts):
+                        return parts
+        return None
+
+    def __bool__(self):
+        return bool(self.patterns)
+
+    def match(self, path: str) -> bool:
+        result = self._memo.get(path)
+        if result is None:
+            result = self._memo[path] = self._match(path)
+        return result
+
+    def _match(self, path: str) -> bool:
+        if self._trie:
+            node = self._trie
+            for part in path.split('/')[:-1]:
+                node = node.get(part)
+                if node is None:
+                    break
+                if None in node:
+                    return True
+        if self._regex is not None:
+            return self._regex.match(path) is not None
+        if self._regexes:
+            return any(regex.match(path) for regex in self._regexes)
+        return False
 
-    return created_data
 
 def compile_exclude_patterns(exclude_list):
     if not exclude_list:
         return []
-    return [re.compile(fnmatch.translate(pattern)) for pattern in exclude_list]
+    # 相同的规则集合共享同一个匹配器（及其路径缓存），mkdocs serve 重新构建时也可复用
+    key = tuple(str(pattern) for pattern in exclude_list)
+    matcher = _exclude_matchers.get(key)
+    if matcher is None:
+        matcher = _exclude_matchers[key] = ExcludeMatcher(key)
+    return matcher
 
 def is_excluded(path, patterns):
     if not patterns:
         return False
+    if isinstance(patterns, ExcludeMatcher):
+        return patterns.match(path)
     first = patterns[0]
     if isinstance(first, re.Pattern):
         for regex in patterns:
@@ -79,17 +367,10 @@ def is_excluded(path, patterns):
 
 def load_file_creation_date(file_path) -> datetime:
     try:
-        stat = os.stat(file_path)
-        system = platform.system().lower()
-        if system.startswith('win'):  # Windows
-            return datetime.fromtimestamp(stat.st_ctime, tz=timezone.utc)
-        elif system == 'darwin':  # macOS
-            try:
-                return datetime.fromtimestamp(stat.st_birthtime, tz=timezone.utc)
-            except AttributeError:
-                return datetime.fromtimestamp(stat.st_ctime, tz=timezone.utc)
-        else:  # Linux, 没有创建时间，使用修改时间
-            return datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+        # Windows: st_ctime，macOS: st_birthtime，Linux: statx 的 btime（文件系统不支持时使用修改时间）
+        _, birth, syscall = _file_times(file_path)
+        profiler.count('fs:stat', **{syscall: 1})
+        return datetime.fromtimestamp(birth, tz=timezone.utc)
     except (OSError, ValueError) as e:
         logger.error(f"Failed to load file creation date for {file_path}: {e}")
         return datetime.now(timezone.utc)
@@ -124,176 +405,563 @@ def parse_commit_authors(name, email, body):
 
     return authors
 
-def load_git_metadata(docs_dir_path: Path):
-    dates_cache = {}
+def _git_relative_arg(docs_dir_path: Path) -> str:
+    git_root = Path(subprocess.check_output(
+        ['git', 'rev-parse', '--show-toplevel'],
+        cwd=docs_dir_path, encoding='utf-8'
+    ).strip())
+    rel_docs_path = docs_dir_path.relative_to(git_root)
+
+    return (
+        '--relative'
+        if rel_docs_path == Path('.')
+        else f'--relative={rel_docs_path.as_posix()}'
+    )
+
+def _iter_git_log_records(cmd, cwd):
+    # 以流的方式按块读取 git log 输出，逐条产出记录，不缓存整个输出，解析与 git 遍历同时进行
+    start = time.perf_counter()
+    output_bytes = 0
+    with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, encoding='utf-8') as process:
+        pending = ''
+        while True:
+            chunk = process.stdout.read(GIT_LOG_CHUNK_SIZE)
+            if not chunk:
+                break
+            if profiler.enabled:
+                output_bytes += len(chunk.encode('utf-8'))
+            *records, pending = (pending + chunk).split('\x1e')
+            yield from records
+        yield pending
+    profiler.count('git:log subprocess', calls=1, wall=time.perf_counter() - start, bytes=output_bytes)
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
+def _scan_git_log(docs_dir_path: Path, rev_range: Optional[str] = None, renames: Optional[dict] = None):
+    cmd = [
+        'git',
+        '-c', 'core.quotepath=false',
+        'log',
+        '--no-merges',
+        '--find-renames',
+        '--use-mailmap',
+        '--name-status',
+        '-z',
+        '--format=%x1e%aN%x1f%aE%x1f%at%x1f%B%x00',
+        _git_relative_arg(docs_dir_path),
+    ]
+    if rev_range:
+        cmd.append(rev_range)
+    cmd.extend(['--', '*.md'])
+
+    # git log 默认从新到旧输出（无需 --reverse，git 不必先缓存全部历史）:
+        # a.第一次出现的提交即最后更新时间和跟踪状态（最近一次为 D 表示已删除）
+        # b.不断覆盖 created，最后留下的就是首次提交时间
+        # c.作者按"先删后插"写入字典，最后整体反转，即得到按首次出现排序的作者列表
+        # d.遇到重命名 old -> new 时，更早的提交中 old 即是 new，记入 follow，之后 old 的记录都归到 new 上
+    history = {}
+    follow = {} if renames is None else renames
+    with profiler.phase('git:scan'):
+        for record in _iter_git_log_records(cmd, docs_dir_path):
+            header, sep, changes = record.partition('\x00')
+            parts = header.split('\x1f', 3)
+            if not sep or len(parts) != 4:
+                continue
+            name, email, ts, body = parts
+            ts = int(ts)
+            authors = parse_commit_authors(name, email, body)
+
+            fields = changes.strip('\x00\n').split('\x00')
+            i = 0
+            while i + 1 < len(fields):
+                status = fields[i]
+                # 重命名/复制记录为: 状态 旧路径 新路径
+                if status.startswith(('R', 'C')) and i + 2 < len(fields):
+                    old_path, file_path = fields[i + 1], fields[i + 2]
+                    i += 3
+                else:
+                    old_path, file_path = None, fields[i + 1]
+                    i += 2
+                if not file_path.endswith('.md'):
+                    continue
+                file_path = follow.get(file_path, file_path)
+                if status.startswith('R') and old_path != file_path:
+                    follow[old_path] = file_path
+
+                entry = history.get(file_path)
+                if entry is None:
+                    entry = history[file_path] = {
+                        'updated': ts,
+                        'tracked': not status.startswith('D'),
+                        'authors': {},
+                    }
+                entry['created'] = ts
+                file_authors = entry['authors']
+                for author in reversed(authors):
+                    file_authors.pop(author, None)
+                    file_authors[author] = None
+
+    for entry in history.values():
+        entry['authors'] = list(reversed(entry['authors']))
+    return history
+
+# 进程内的 git 历史缓存，以 (git 根目录, HEAD, docs 相对路径) 为键，所有插件实例共享
+# i18n、monorepo 等在同一进程中多次构建同一仓库时，历史只遍历一次；缓存的结果只读，调用方不能修改
+_git_history_memo = {}
+
+def clear_git_history_memo():
+    _git_history_memo.clear()
+
+def _git_history_key(docs_dir_path: Path):
     try:
-        git_root = Path(subprocess.check_output(
-            ['git', 'rev-parse', '--show-toplevel'],
-            cwd=docs_dir_path, encoding='utf-8'
-        ).strip())
-        rel_docs_path = docs_dir_path.relative_to(git_root)
+        git_root, head = subprocess.check_output(
+            ['git', 'rev-parse', '--show-toplevel', 'HEAD'],
+            cwd=docs_dir_path, encoding='utf-8', stderr=subprocess.DEVNULL
+        ).splitlines()
+        git_root = Path(git_root).resolve()
+        rel_docs_path = Path(docs_dir_path).resolve().relative_to(git_root).as_posix()
+        return str(git_root), head, rel_docs_path
+    except Exception as e:
+        logger.info(f"Git history memo disabled for {docs_dir_path}: {e}")
+        return None
+
+def _remember_git_history(key, history):
+    if key is None:
+        return
+    # 同一 docs 目录只保留最新 HEAD 的结果，避免 serve 期间不断提交时缓存增长
+    git_root, _, rel_docs_path = key
+    for other in list(_git_history_memo):
+        if other[0] == git_root and other[2] == rel_docs_path:
+            _git_history_memo.pop(other, None)
+    _git_history_memo[key] = history
+
+def scan_git_history(docs_dir_path: Path, rev_range: Optional[str] = None):
+    """
+    单次遍历 git 历史，同时得到每个文档的首次提交时间、最后提交时间、有序作者列表，以及是否仍被跟踪
+    rev_range 用于只扫描部分历史，如 '<commit>..HEAD'
+
+    返回: {rel_path: {'created': ts, 'updated': ts, 'authors': [(name, email), ...], 'tracked': bool}}
+    """
+    key = _git_history_key(docs_dir_path) if rev_range is None else None
+    history = _git_history_memo.get(key)
+    if history is not None:
+        return history
 
-        relative_arg = (
-            '--relative'
-            if rel_docs_path == Path('.')
-            else f'--relative={rel_docs_path.as_posix()}'
-        )
-        cmd = [
-            'git',
-            '-c', 'core.quotepath=false',
-            'log',
-            '--reverse',
-            '--no-merges',
-            '--use-mailmap',
-            '--name-only',
-            '-z',
-            '--format=%aN%x1f%aE%x1f%at%x1f%B%x00',
-            relative_arg,
-            '--',
-            '*.md'
-        ]
-        process = subprocess.run(cmd, cwd=docs_dir_path, capture_output=True, encoding='utf-8')
-        if process.returncode == 0:
-            authors_dict = defaultdict(dict)
-            first_commit = {}
-            current_commit = None
-
-            records = process.stdout.split('\x00')
-            for item in records:
-                item = item.strip()
-                if not item:
-                    continue
+    try:
+        history = _scan_git_log(docs_dir_path, rev_range)
+    except Exception as e:
+        logger.info(f"Error scanning git history in {docs_dir_path}: {e}")
+        return {}
+    _remember_git_history(key, history)
+    return history
+
+def _merge_git_history(history, delta, renames=None):
+    # delta 是 history 之后的提交，但合并进来的分支中可能有比已索引提交更早的提交:
+    # created 取较早值，updated 取较晚值，跟踪状态以较晚的一方为准，作者按首次出现顺序追加
+    # renames 是 delta 中的重命名 {旧路径: 新路径}，旧路径的历史先并入新路径
+    for old_path, file_path in (renames or {}).items():
+        old_entry = history.pop(old_path, None)
+        if old_entry is None:
+            continue
+        entry = history.get(file_path)
+        if entry is not None:
+            # 新路径在更早的历史中也存在过（极少见），按首次提交时间先后合并
+            older, newer = sorted((old_entry, entry), key=itemgetter('created'))
+            older['authors'] = list(dict.fromkeys(older['authors'] + newer['authors']))
+            old_entry = older
+        old_entry['tracked'] = False
+        history[file_path] = old_entry
+
+    for file_path, new_entry in delta.items():
+        entry = history.get(file_path)
+        if entry is None:
+            history[file_path] = new_entry
+            continue
+        entry['created'] = min(entry['created'], new_entry['created'])
+        if new_entry['updated'] >= entry['updated']:
+            entry['updated'] = new_entry['updated']
+            entry['tracked'] = new_entry['tracked']
+        authors = dict.fromkeys(entry['authors'])
+        authors.update(dict.fromkeys(new_entry['authors']))
+        entry['authors'] = list(authors)
+    return history
+
+def _read_git_index(index_file: Path):
+    try:
+        with open(index_file, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') != GIT_INDEX_VERSION or not index.get('head'):
+            return None
+        for entry in index['files'].values():
+            entry['authors'] = [tuple(author) for author in entry['authors']]
+        return index
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+def _write_git_index(index_file: Path, head: str, history):
+    temp_name = None
+    try:
+        ensure_cache_dir(index_file.parent)
+        # 临时文件名唯一，并发构建不会互相覆盖
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=index_file.parent, prefix=index_file.name + '.', suffix='.tmp', delete=False) as f:
+            temp_name = f.name
+            json.dump({'version': GIT_INDEX_VERSION, 'head': head, 'files': history}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_name, index_file)
+    except OSError as e:
+        logger.info(f"Failed to write git index {index_file}: {e}")
+        if temp_name and os.path.exists(temp_name):
+            os.remove(temp_name)
+
+def load_git_history(docs_dir_path: Path, cache_dir: Optional[Path] = None):
+    """
+    带持久化索引的 scan_git_history，索引以最后一次索引的提交为键（同一进程内优先使用内存中的结果）:
+        - HEAD 未变化: 直接使用索引
+        - 索引提交仍是 HEAD 的祖先: 只扫描 '<indexed>..HEAD' 并合并
+        - 历史被改写（rebase、force push 等）: 全量重新扫描
+    """
+    if cache_dir is None:
+        return scan_git_history(docs_dir_path)
+
+    key = _git_history_key(docs_dir_path)
+    if key is None:
+        return scan_git_history(docs_dir_path)
+    history = _git_history_memo.get(key)
+    if history is not None:
+        return history
+    _, head, rel_docs_path = key
+
+    index_key = hashlib.md5(rel_docs_path.encode('utf-8')).hexdigest()[:12]
+    index_file = Path(cache_dir) / f'git_index_{index_key}.json'
+    index = _read_git_index(index_file)
+
+    if index and index['head'] == head:
+        _remember_git_history(key, index['files'])
+        return index['files']
 
-                parts = item.split('\x1f', 3)
-                if len(parts) == 4:
-                    name, email, created, body = parts
-                    authors = parse_commit_authors(name, email, body)
-                    current_commit = (authors, int(created))
-                elif item.endswith('.md') and current_commit:
-                    authors, created = current_commit
-                    # 使用 defaultdict(dict)结构，处理有序与去重
-                        # a.巧用 Python 字典的 setdefault 特性来去重（setdefault 为不存在的键提供初始值，不会覆盖已有值）
-                        # b.巧用 Python 字典的插入顺序特性来保留内容插入顺序（Python 3.7+ 字典会保持插入顺序）
-                    for author in authors:
-                        authors_dict[item].setdefault(author, None)
-
-                    first_commit.setdefault(item, created)
-
-            # 构建最终的缓存数据
-            for file_path in first_commit:
-                authors_list = [
-                    {'name': name, 'email': email}
-                    for name, email in authors_dict[file_path].keys()  # 这里的 keys() 是有序的
-                ]
-                dates_cache[file_path] = {
-                    'created': first_commit[file_path],
-                    'authors': authors_list
-                }
+    try:
+        history = None
+        if index:
+            is_ancestor = subprocess.run(
+                ['git', 'merge-base', '--is-ancestor', index['head'], head],
+                cwd=docs_dir_path, capture_output=True
+            ).returncode == 0
+            if is_ancestor:
+                renames = {}
+                delta = _scan_git_log(docs_dir_path, f"{index['head']}..{head}", renames)
+                history = _merge_git_history(index['files'], delta, renames)
+                logger.info(f"Git index updated incrementally: {index['head'][:7]}..{head[:7]}, {len(delta)} files changed")
+
+        if history is None:
+            history = _scan_git_log(docs_dir_path)
     except Exception as e:
-        logger.info(f"Error getting git info in {docs_dir_path}: {e}")
+        logger.info(f"Error scanning git history in {docs_dir_path}: {e}")
+        return {}
+
+    _write_git_index(index_file, head, history)
+    _remember_git_history(key, history)
+    return history
+
+def load_git_metadata(docs_dir_path: Path):
+    dates_cache = {}
+    for file_path, entry in scan_git_history(docs_dir_path).items():
+        dates_cache[file_path] = {
+            'created': entry['created'],
+            'authors': [{'name': name, 'email': email} for name, email in entry['authors']]
+        }
     return dates_cache
 
 def load_git_last_updated_dates(docs_dir_path: Path):
-    doc_mtime_map = {}
+    # 只记录已跟踪的文件（排除已删除、重命名、不再跟踪）
+    return {
+        file_path: entry['updated']
+        for file_path, entry in scan_git_history(docs_dir_path).items()
+        if entry['tracked']
+    }
+
+def load_git_first_commit_dates(docs_dir_path: Path):
+    # 单次遍历 git 历史得到所有文档的首次提交时间，代替逐个文件调用 load_git_first_commit_date
+    return {
+        file_path: datetime.fromtimestamp(entry['created'], tz=timezone.utc)
+        for file_path, entry in scan_git_history(docs_dir_path).items()
+    }
+
+def write_dates_index(index_file: Path, history, head: Optional[str] = None):
+    """
+    将 scan_git_history 的结果导出为单个紧凑文件，供浅克隆等无完整历史的环境构建时使用
+        - 作者去重后存为列表，文件条目只引用作者序号
+        - 文件名以 .gz 结尾时使用 gzip 压缩
+    写入失败时抛出 OSError
+    """
+    authors, author_ids, files = [], {}, {}
+    for file_path in sorted(history):
+        entry = history[file_path]
+        ids = []
+        for author in entry['authors']:
+            author = tuple(author)
+            author_id = author_ids.get(author)
+            if author_id is None:
+                author_id = author_ids[author] = len(authors)
+                authors.append(list(author))
+            ids.append(author_id)
+        files[file_path] = [entry['created'], entry['updated'], int(entry['tracked']), ids]
+
+    data = json.dumps({
+        'version': DATES_INDEX_VERSION,
+        'head': head,
+        'authors': authors,
+        'files': files,
+    }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    if index_file.suffix == '.gz':
+        # 固定 mtime，内容不变时导出的文件也完全相同
+        buffer = io.BytesIO()
+        with gzip.GzipFile(fileobj=buffer, mode='wb', mtime=0) as f:
+            f.write(data)
+        data = buffer.getvalue()
+
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = index_file.with_name(index_file.name + '.tmp')
+    temp_file.write_bytes(data)
+    temp_file.replace(index_file)
+
+def load_dates_index(index_file: Path):
+    # 读取 write_dates_index 导出的索引，返回 (与 scan_git_history 相同结构的结果, 导出时的 HEAD)，文件缺失或格式不符时返回 None
     try:
-        git_root = Path(subprocess.check_output(
-            ['git', 'rev-parse', '--show-toplevel'],
-            cwd=docs_dir_path, encoding='utf-8'
-        ).strip())
-        rel_docs_path = docs_dir_path.relative_to(git_root)
-
-        relative_arg = (
-            '--relative'
-            if rel_docs_path == Path('.')
-            else f'--relative={rel_docs_path.as_posix()}'
-        )
-        cmd = ['git', '-c', 'core.quotepath=false', 'log', '--no-merges', '--use-mailmap', '--format=%aN|%aE|%at', '--name-only', relative_arg, '--', '*.md']
-        process = subprocess.run(cmd, cwd=docs_dir_path, capture_output=True, encoding='utf-8')
-        if process.returncode == 0:
-            result = subprocess.run(
-                ['git', '-c', 'core.quotepath=false', 'ls-files', '*.md'],
-                cwd=docs_dir_path, capture_output=True, encoding='utf-8'
-            )
-            # 只记录已跟踪的文件（还有已删除、重命名、不再跟踪）
-            tracked_files = set(result.stdout.splitlines()) if result.stdout else set()
-
-            ts = None
-            for line in process.stdout.splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                if '|' in line:
-                    ts = int(line.split('|')[2])
-                elif line.endswith('.md') and line in tracked_files and ts:
-                    # 只记录第一次出现的文件，即最近一次提交（setdefault 机制不会覆盖已有值）
-                    doc_mtime_map.setdefault(line, ts)
-    except Exception as e:
-        logger.info(f"Error getting git tracked files in {docs_dir_path}: {e}")
-
-    return doc_mtime_map
+        data = Path(index_file).read_bytes()
+        if data[:2] == b'\x1f\x8b':
+            data = gzip.decompress(data)
+        index = json.loads(data)
+        if index.get('version') != DATES_INDEX_VERSION:
+            logger.warning(f"Unsupported dates index version in {index_file}, falling back to git")
+            return None
+        authors = [tuple(author) for author in index['authors']]
+        history = {
+            file_path: {
+                'created': created,
+                'updated': updated,
+                'tracked': bool(tracked),
+                'authors': [authors[author_id] for author_id in author_ids],
+            }
+            for file_path, (created, updated, tracked, author_ids) in index['files'].items()
+        }
+        return history, index.get('head')
+    except (OSError, ValueError, KeyError, TypeError, IndexError, AttributeError) as e:
+        logger.warning(f"Failed to load dates index {index_file}, falling back to git: {e}")
+        return None
+
+def _catch_up_dates_index(docs_dir_path: Path, index_file: Path, history, index_head: Optional[str]):
+    """
+    索引导出后仓库又有新提交时（如 CI 产物落后于当前检出），需要补上之后的历史:
+        - 导出时的提交在本地历史中且是 HEAD 的祖先: 只扫描 '<index_head>..HEAD' 并合并
+        - 否则（如浅克隆中缺少该提交）: 警告索引已过期，之后提交的日期会缺失
+    """
+    if not index_head:
+        return history
+    try:
+        head = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=docs_dir_path, encoding='utf-8', stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        # 没有 git 环境，无法校验，直接使用索引
+        return history
+    if head == index_head:
+        return history
+
+    is_ancestor = subprocess.run(
+        ['git', 'merge-base', '--is-ancestor', index_head, head],
+        cwd=docs_dir_path, capture_output=True
+    ).returncode == 0
+    if is_ancestor:
+        try:
+            renames = {}
+            delta = _scan_git_log(docs_dir_path, f"{index_head}..{head}", renames)
+            logger.info(f"Dates index {index_file} caught up: {index_head[:7]}..{head[:7]}, {len(delta)} files changed")
+            return _merge_git_history(history, delta, renames)
+        except Exception as e:
+            logger.info(f"Error scanning git history after {index_head[:7]} in {docs_dir_path}: {e}")
+
+    logger.warning(
+        f"Dates index {index_file} was exported at {index_head[:7]} but HEAD is {head[:7]}, "
+        f"dates of later commits are missing; re-export it with mdd-index"
+    )
+    return history
 
 # 建议在 on_page_markdown 之后的全局事件中调用，因为需要读取 page.meta 中的信息
-def get_recently_updated_files(existing_dates: dict, files: Files, exclude_list: list, limit: int = 10, recent_enable: bool = False, prefix: str = "", wpm: int = DEFAULT_WPM, wpm_cjk: int = DEFAULT_WPM_CJK):
-    recently_updated_results = []
-    if recent_enable:
-        files_meta = []
+def get_recently_updated_files(existing_dates: dict, files: Files, exclude_list: list, limit: int = 10, recent_enable: bool = False, prefix: str = "", wpm: int = DEFAULT_WPM, wpm_cjk: int = DEFAULT_WPM_CJK, analysis_cache=None):
+    if not recent_enable:
+        return []
+    index = RecentlyUpdatedIndex(existing_dates, files, prefix, wpm, wpm_cjk, analysis_cache)
+    return index.query(exclude_list=exclude_list, limit=limit)
+
+
+class RecentlyUpdatedIndex:
+    """
+    最近更新列表的排序索引，每次构建只建立一次，所有列表都从中查询
+        - entries: 按更新时间倒序排列的 (updated_ts, rel_path, file)
+        - 目录前缀和标签的倒排索引，存储的是 entries 中的位置（升序即时间倒序）
+        - 文档详情（摘要、阅读时间等）按需生成，多个列表共享
+    """
+
+    def __init__(self, existing_dates: dict, files: Files, prefix: str = "", wpm: int = DEFAULT_WPM, wpm_cjk: int = DEFAULT_WPM_CJK, analysis_cache=None, file_stats=None):
+        self.prefix = prefix
+        self.wpm = wpm
+        self.wpm_cjk = wpm_cjk
+        self.analysis_cache = analysis_cache
+        self._docs = {}
+
+        candidates = []
         for file in files:
             if file.inclusion.is_excluded():
                 continue
             if not file.src_path.endswith('.md'):
                 continue
             rel_path = getattr(file, 'src_uri')
-            if is_excluded(rel_path, exclude_list):
-                continue
 
-            # 优先从现有数据获取 mtime，如果不存在则 fallback 到文件系统 mtime
+            # 优先从现有数据获取 mtime，如果不存在则 fallback 到文件系统 mtime（优先使用 scan_file_stats 的结果）
             exist_updated: datetime = existing_dates.get(rel_path, {}).get('updated')
-            mtime = exist_updated.timestamp() if exist_updated else os.path.getmtime(file.abs_src_path)
-
-            # 获取文档其它信息
-            title = file.page.title if file.page and file.page.title else file.name
-            url = prefix + (file.page.url if file.page and file.page.url else file.url)
-            tags = (file.page.meta.get("tags") or []) if file.page else []
-
-            cover = ''
-            summary = ''
-            readtime = 0
-            # authors = []
-            if file.page:
-                cover = file.page.meta.get('cover', '')
-                if cover and not cover.startswith(('http', 'ftp')):
-                    cover = prefix + cover.lstrip('/')
-                # authors = file.page.meta.document_dates.authors
-                if file.page.file:
-                    readtime, summary = analyze_markdown(file.page.file.content_string, wpm, wpm_cjk)
-
-            meta_readtime = int((file.page.meta.get('readtime') or 0) if file.page else 0)
-            readtime = meta_readtime if meta_readtime > 0 else readtime
-
-            # 存储信息（更新时间、路径、标题、URL、封面、摘要、阅读时间、标签）
-            files_meta.append({
-                "updated_ts": mtime,
-                "rel_path": rel_path,
-                "title": title,
-                "url": url,
-                "cover": cover,
-                "summary": summary,
-                "readtime": readtime,
-                "tags": tags,
-            })
-
-        # 构建最近更新列表
-        if files_meta:
-            # heapq 取 top limit
-            recently_updated_results = heapq.nlargest(limit, files_meta, key=itemgetter("updated_ts"))
-
-            for doc in recently_updated_results:
-                # timestamp -> utc datetime -> local datetime
-                dt = datetime.fromtimestamp(doc["updated_ts"], tz=timezone.utc).astimezone()
-                doc["updated_dt"] = dt.isoformat()
-                doc["updated"] = dt.date().isoformat()
-
-    return recently_updated_results
+            if exist_updated:
+                mtime = exist_updated.timestamp()
+            else:
+                file_stat = file_stats.get(file.abs_src_path) if file_stats else None
+                mtime = file_stat[0] / 1e9 if file_stat else os.path.getmtime(file.abs_src_path)
+            candidates.append((mtime, rel_path, file))
+
+        # 稳定排序，更新时间相同的文档保持原有顺序
+        candidates.sort(key=itemgetter(0), reverse=True)
+        self.entries = candidates
+
+        self.by_dir = {}
+        self.by_tag = {}
+        for position, (_, rel_path, file) in enumerate(candidates):
+            parts = rel_path.split('/')[:-1]
+            for depth in range(1, len(parts) + 1):
+                self.by_dir.setdefault('/'.join(parts[:depth]) + '/', []).append(position)
+            tags = (file.page.meta.get('tags') or []) if file.page else []
+            if isinstance(tags, str):
+                tags = [tags]
+            for tag in set(map(str, tags)):
+                self.by_tag.setdefault(tag, []).append(position)
+
+    def query(self, paths=None, tags=None, exclude_list=None, limit: int = 10):
+        """
+        按目录前缀和/或标签筛选（同类条件为"或"，两类条件之间为"且"），返回前 limit 个文档
+            paths: 目录前缀列表，如 ['api/']，'' 或 '/' 表示整个文档目录
+            tags: 标签列表
+            exclude_list: compile_exclude_patterns 编译后的排除规则
+        """
+        positions = None
+        dirs = [path.strip('/') for path in paths or []]
+        # 根目录前缀匹配所有文档，等同于不按目录筛选
+        if dirs and all(dirs):
+            positions = self._union(self.by_dir.get(path + '/', []) for path in dirs)
+        if tags:
+            tagged = self._union(self.by_tag.get(str(tag), []) for tag in tags)
+            positions = tagged if positions is None else sorted(set(positions).intersection(tagged))
+        if positions is None:
+            positions = range(len(self.entries))
+
+        results = []
+        for position in positions:
+            if len(results) >= limit:
+                break
+            _, rel_path, _ = self.entries[position]
+            if exclude_list and is_excluded(rel_path, exclude_list):
+                continue
+            results.append(self._doc(position))
+        return results
+
+    @staticmethod
+    def _union(position_lists):
+        position_lists = [positions for positions in position_lists if positions]
+        if len(position_lists) == 1:
+            return position_lists[0]
+        return sorted(set().union(*position_lists))
+
+    def _doc(self, position):
+        mtime, rel_path, file = self.entries[position]
+        doc = self._docs.get(rel_path)
+        if doc is None:
+            doc = self._docs[rel_path] = _build_recent_doc(file, rel_path, mtime, self.prefix, self.wpm, self.wpm_cjk, self.analysis_cache)
+        return doc
+
+def _build_recent_doc(file, rel_path: str, mtime: float, prefix: str, wpm: int, wpm_cjk: int, analysis_cache=None):
+    # 获取文档其它信息
+    title = file.page.title if file.page and file.page.title else file.name
+    url = prefix + (file.page.url if file.page and file.page.url else file.url)
+    tags = (file.page.meta.get("tags") or []) if file.page else []
+
+    cover = ''
+    summary = ''
+    readtime = 0
+    # authors = []
+    if file.page:
+        cover = file.page.meta.get('cover', '')
+        if cover and not cover.startswith(('http', 'ftp')):
+            cover = prefix + cover.lstrip('/')
+        # authors = file.page.meta.document_dates.authors
+        if file.page.file:
+            analyze = analysis_cache.analyze if analysis_cache else analyze_markdown
+            with profiler.phase('recently_updated:analyze_markdown'):
+                readtime, summary = analyze(file.page.file.content_string, wpm, wpm_cjk)
+
+    meta_readtime = int((file.page.meta.get('readtime') or 0) if file.page else 0)
+    readtime = meta_readtime if meta_readtime > 0 else readtime
+
+    # timestamp -> utc datetime -> local datetime
+    dt = datetime.fromtimestamp(mtime, tz=timezone.utc).astimezone()
+
+    # 存储信息（更新时间、路径、标题、URL、封面、摘要、阅读时间、标签）
+    return {
+        "updated_ts": mtime,
+        "rel_path": rel_path,
+        "title": title,
+        "url": url,
+        "cover": cover,
+        "summary": summary,
+        "readtime": readtime,
+        "tags": tags,
+        "updated_dt": dt.isoformat(),
+        "updated": dt.date().isoformat(),
+    }
+
+# ===== .dates_cache.jsonl =====
+# 每行一个 {path: {"created": iso}}，同一路径以最后一行为准，{path: null} 表示删除
+# 钩子只追加变更行，行数远多于条目数时才整体重写（压缩），保持 merge=union 友好
+JSONL_INDEX_VERSION = 1
+JSONL_COMPACT_MIN_LINES = 200
+JSONL_COMPACT_RATIO = 2
+
+
+def _jsonl_line_key(line: str):
+    # 由 write/append 写入的行格式固定为 {"path": ...}，直接截取路径，无需 json.loads
+    if line.startswith('{"'):
+        end = line.find('": ', 2)
+        if end != -1 and '\\' not in line[2:end]:
+            return line[2:end]
+    entry = json.loads(line)
+    if isinstance(entry, dict) and len(entry) == 1:
+        return next(iter(entry))
+    return None
+
+def _apply_jsonl_line(line: str, dates_cache: dict):
+    line = line.strip()
+    if not line:
+        return
+    try:
+        entry = json.loads(line)
+        if entry and isinstance(entry, dict) and len(entry) == 1:
+            file_path, file_info = next(iter(entry.items()))
+            if file_info is None:
+                dates_cache.pop(file_path, None)
+            elif isinstance(file_info, dict):
+                created = file_info.get('created')
+                if isinstance(created, str):
+                    file_info['created'] = int(datetime.fromisoformat(created).timestamp())
+                elif isinstance(created, (int, float)):
+                    file_info['created'] = int(created)
+                dates_cache[file_path] = file_info
+    except (json.JSONDecodeError, StopIteration, ValueError, TypeError,) as e:
+        logger.warning(f"Skipping invalid JSONL line: {e}")
 
 def read_jsonl_cache(jsonl_file: Path):
     dates_cache = {}
@@ -301,23 +969,155 @@ def read_jsonl_cache(jsonl_file: Path):
         try:
             with open(jsonl_file, 'r', encoding='utf-8') as f:
                 for line in f:
-                    try:
-                        entry = json.loads(line.strip())
-                        if entry and isinstance(entry, dict) and len(entry) == 1:
-                            file_path, file_info = next(iter(entry.items()))
-                            if isinstance(file_info, dict):
-                                created = file_info.get('created')
-                                if isinstance(created, str):
-                                    file_info['created'] = int(datetime.fromisoformat(created).timestamp())
-                                elif isinstance(created, (int, float)):
-                                    file_info['created'] = int(created)
-                                dates_cache[file_path] = file_info
-                    except (json.JSONDecodeError, StopIteration, ValueError, TypeError,) as e:
-                        logger.warning(f"Skipping invalid JSONL line: {e}")
+                    _apply_jsonl_line(line, dates_cache)
         except OSError as e:
             logger.warning(f"Error reading from '.dates_cache.jsonl': {str(e)}")
     return dates_cache
 
+def read_jsonl_cache_entries(jsonl_file: Path, paths):
+    """
+    只解析指定路径的行（其余行只截取路径），用于钩子的增量更新
+    返回: (条目, 总行数, 有效路径数)
+    """
+    paths = set(paths)
+    entries = {}
+    live = set()
+    lines = 0
+    try:
+        with open(jsonl_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                lines += 1
+                try:
+                    key = _jsonl_line_key(line)
+                except ValueError:
+                    continue
+                if key is None:
+                    continue
+                if line.rstrip().endswith(': null}'):
+                    live.discard(key)
+                else:
+                    live.add(key)
+                if key in paths:
+                    _apply_jsonl_line(line, entries)
+    except OSError as e:
+        logger.warning(f"Error reading from '.dates_cache.jsonl': {str(e)}")
+    return entries, lines, len(live)
+
+def needs_compaction(lines: int, live: int) -> bool:
+    return lines > JSONL_COMPACT_MIN_LINES and lines > live * JSONL_COMPACT_RATIO
+
+def load_jsonl_cache(jsonl_file: Path, cache_dir: Optional[Path] = None):
+    """
+    带索引的 read_jsonl_cache：解析结果保存在 cache_dir 中
+        - 文件未变化: 直接使用索引
+        - 文件只是被追加（已索引部分的哈希不变）: 只解析新增的行
+        - 否则（压缩、合并、手动编辑）: 全量解析
+    """
+    if cache_dir is None:
+        return read_jsonl_cache(jsonl_file)
+    try:
+        stat = jsonl_file.stat()
+    except OSError:
+        return {}
+
+    index_file = cache_dir / f"dates_cache_index_{hashlib.md5(str(jsonl_file.resolve()).encode('utf-8')).hexdigest()[:12]}.json"
+    index = None
+    try:
+        with open(index_file, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') != JSONL_INDEX_VERSION:
+            index = None
+        elif index['size'] == stat.st_size and index['mtime_ns'] == stat.st_mtime_ns:
+            return index['entries']
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        index = None
+
+    try:
+        data = jsonl_file.read_bytes()
+    except OSError as e:
+        logger.warning(f"Error reading from '.dates_cache.jsonl': {str(e)}")
+        return {}
+
+    entries, start = {}, 0
+    if index and 0 < index.get('offset', 0) <= len(data):
+        offset = index['offset']
+        if hashlib.sha1(data[:offset]).hexdigest() == index.get('digest'):
+            entries, start = index['entries'], offset
+
+    # 只索引到最后一个完整行
+    end = data.rfind(b'\n') + 1
+    if end > start:
+        for line in data[start:end].decode('utf-8', errors='replace').splitlines():
+            _apply_jsonl_line(line, entries)
+        start = end
+
+    temp_name = None
+    try:
+        ensure_cache_dir(index_file.parent)
+        # 临时文件名唯一，并发构建不会互相覆盖
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=index_file.parent, prefix=index_file.name + '.', suffix='.tmp', delete=False) as f:
+            temp_name = f.name
+            json.dump({
+                'version': JSONL_INDEX_VERSION,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'offset': start,
+                'digest': hashlib.sha1(data[:start]).hexdigest(),
+                'entries': entries,
+            }, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_name, index_file)
+    except OSError as e:
+        logger.info(f"Failed to write dates cache index {index_file}: {e}")
+        if temp_name and os.path.exists(temp_name):
+            os.remove(temp_name)
+
+    # 末尾不完整的行（如手动编辑）不写入索引
+    if start < len(data) and data[start:].strip():
+        entries = dict(entries)
+        _apply_jsonl_line(data[start:].decode('utf-8', errors='replace'), entries)
+    return entries
+
+# 同一仓库中的 git add 会争用 index.lock，并发处理多个项目时需串行执行
+_git_add_lock = threading.Lock()
+
+def git_add(*paths, **kwargs):
+    with _git_add_lock:
+        subprocess.run(["git", "add", *map(str, paths)], check=True, **kwargs)
+
+def _format_jsonl_line(file_path: str, file_info) -> str:
+    if file_info is not None:
+        file_info = file_info.copy()
+        created = file_info.get('created')
+        if created is not None:
+            file_info['created'] = datetime.fromtimestamp(created, tz=timezone.utc).isoformat()
+    return json.dumps({file_path: file_info}, ensure_ascii=False) + '\n'
+
+def append_jsonl_cache(jsonl_file: Path, changes: dict):
+    """
+    追加变更行（changes 中值为 None 表示删除），不重写已有内容
+    """
+    try:
+        prefix = ''
+        if jsonl_file.exists() and jsonl_file.stat().st_size > 0:
+            with open(jsonl_file, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    prefix = '\n'
+        with open(jsonl_file, 'a', encoding='utf-8') as f:
+            f.write(prefix + ''.join(_format_jsonl_line(file_path, file_info) for file_path, file_info in changes.items()))
+
+        # 将文件添加到git
+        git_add(jsonl_file)
+        logger.info(f"Appended {len(changes)} entries to JSONL cache file: {jsonl_file}")
+        return True
+    except OSError as e:
+        logger.warning(f"Failed to append to JSONL cache file {jsonl_file}: {e}")
+    except Exception as e:
+        logger.warning(f"Failed to add JSONL cache file to git: {e}")
+    return False
+
 def write_jsonl_cache(jsonl_file: Path, dates_cache, tracked_files):
     try:
         # 使用临时文件写入，然后替换原文件，避免写入过程中的问题
@@ -325,18 +1125,13 @@ def write_jsonl_cache(jsonl_file: Path, dates_cache, tracked_files):
         with open(temp_file, 'w', encoding='utf-8') as f:
             for file_path in tracked_files:
                 if file_path in dates_cache:
-                    file_info = dates_cache[file_path].copy()
-                    created = file_info.get('created')
-                    if created is not None:
-                        file_info['created'] = datetime.fromtimestamp(created, tz=timezone.utc).isoformat()
-                    entry = {file_path: file_info}
-                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                    f.write(_format_jsonl_line(file_path, dates_cache[file_path]))
         
         # 替换原文件
         temp_file.replace(jsonl_file)
         
         # 将文件添加到git
-        subprocess.run(["git", "add", str(jsonl_file)], check=True)
+        git_add(jsonl_file)
         logger.info(f"Successfully updated JSONL cache file: {jsonl_file}")
         return True
     except OSError as e:
@@ -610,3 +1405,84 @@ def analyze_markdown(md: str, readtime_wpm: int = DEFAULT_WPM, readtime_wpm_cjk:
     summary = MD_SYNTAX_RE.sub("", "  ".join(summary_lines)).strip()
 
     return minutes, summary
+
+
+class MarkdownAnalysisCache:
+    """
+    analyze_markdown 结果的持久化缓存，键为 (解析器版本, readtime_wpm, readtime_wpm_cjk, 内容哈希)
+        - 构建开始时加载一次，同一进程内（mkdocs serve）常驻内存
+        - 多个配置（如多语言站点）可共享同一缓存文件：保存时先合并磁盘上的最新内容，
+          每次写入代数加一，连续 ANALYSIS_CACHE_MAX_AGE 次写入都未用到的条目才会被淘汰
+        - 键与文档路径无关，可在不同 CI 运行之间共享
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file
+        self._generation = 0
+        self._entries = {}
+        self._generations = {}
+        self._used = {}
+        self._dirty = False
+        if cache_file:
+            self._generation, self._entries, self._generations = self._read()
+
+    def _read(self):
+        # 返回 (代数, {键: 结果}, {键: 最后使用的代数})
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != ANALYZER_VERSION:
+                return 0, {}, {}
+            entries, generations = {}, {}
+            for key, value in data['entries'].items():
+                entries[key] = (value[0], value[1])
+                generations[key] = value[2] if len(value) > 2 else 0
+            return data.get('generation', 0), entries, generations
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, IndexError):
+            return 0, {}, {}
+
+    def analyze(self, md: str, readtime_wpm: int = DEFAULT_WPM, readtime_wpm_cjk: int = DEFAULT_WPM_CJK) -> tuple[int, str]:
+        digest = hashlib.sha1(md.encode('utf-8')).hexdigest()
+        key = f"{ANALYZER_VERSION}:{readtime_wpm}:{readtime_wpm_cjk}:{digest}"
+        result = self._used.get(key) or self._entries.get(key)
+        if result is None:
+            result = analyze_markdown(md, readtime_wpm, readtime_wpm_cjk)
+            self._dirty = True
+        self._used[key] = result
+        return result
+
+    def save(self):
+        used, self._used = self._used, {}
+        if not self.cache_file:
+            self._entries.update(used)
+            return
+        # 没有新条目、用到的条目都已是最新代数时无需写入
+        if not self._dirty and all(self._generations.get(key) == self._generation for key in used):
+            return
+
+        generation, entries, generations = self._read()
+        generation = max(generation, self._generation) + 1
+        entries.update(used)
+        generations.update(dict.fromkeys(used, generation))
+        for key in [key for key, used_in in generations.items() if used_in <= generation - ANALYSIS_CACHE_MAX_AGE]:
+            entries.pop(key, None)
+            generations.pop(key, None)
+        self._generation, self._entries, self._generations = generation, entries, generations
+        self._dirty = False
+
+        temp_name = None
+        try:
+            ensure_cache_dir(self.cache_file.parent)
+            # 临时文件名唯一，并发构建不会互相覆盖
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.cache_file.parent, prefix=self.cache_file.name + '.', suffix='.tmp', delete=False) as f:
+                temp_name = f.name
+                json.dump({
+                    'version': ANALYZER_VERSION,
+                    'generation': generation,
+                    'entries': {key: [*entries[key], generations[key]] for key in entries},
+                }, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_name, self.cache_file)
+        except OSError as e:
+            logger.info(f"Failed to write analysis cache {self.cache_file}: {e}")
+            if temp_name and os.path.exists(temp_name):
+                os.remove(temp_name)
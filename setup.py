@@ -30,6 +30,8 @@ def legacy_setup():
             "console_scripts": [
                 "mkdocs-document-dates-hooks=mkdocs_document_dates.hooks_installer:install",
                 "mdd-hooks=mkdocs_document_dates.hooks_installer:install",
+                "mkdocs-document-dates-index=mkdocs_document_dates.index_exporter:export",
+                "mdd-index=mkdocs_document_dates.index_exporter:export",
             ],
         },
         package_data={
@@ -0,0 +1,17 @@
+import os
+import subprocess
+
+
+def git(repo, *args, timestamp=None):
+    env = dict(os.environ, GIT_AUTHOR_NAME="Alice", GIT_AUTHOR_EMAIL="a@example.com",
+               GIT_COMMITTER_NAME="Alice", GIT_COMMITTER_EMAIL="a@example.com")
+    if timestamp is not None:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = f"@{timestamp} +0000"
+    return subprocess.run(["git", *args], cwd=repo, env=env, check=True, capture_output=True, text=True).stdout
+
+
+def commit(repo, path, lines, timestamp):
+    (repo / path).parent.mkdir(parents=True, exist_ok=True)
+    (repo / path).write_text("\n".join(lines) + "\n", encoding="utf-8")
+    git(repo, "add", path)
+    git(repo, "commit", "-q", "-m", f"edit {path}", timestamp=timestamp)
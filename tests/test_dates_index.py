@@ -0,0 +1,46 @@
+import logging
+
+from mkdocs_document_dates import utils
+
+from gitutils import git, commit
+
+
+def _export(repo, docs, tmp_path):
+    utils.clear_git_history_memo()
+    index_file = tmp_path / "index.json.gz"
+    utils.write_dates_index(index_file, utils.scan_git_history(docs), git(repo, "rev-parse", "HEAD").strip())
+    return index_file
+
+
+def _init(tmp_path):
+    repo = tmp_path / "repo"
+    docs = repo / "docs"
+    docs.mkdir(parents=True)
+    git(repo, "init", "-q", "-b", "main")
+    commit(repo, "docs/a.md", ["# a"], 1600000000)
+    return repo, docs
+
+
+def test_index_catches_up_with_later_commits(tmp_path):
+    repo, docs = _init(tmp_path)
+    index_file = _export(repo, docs, tmp_path)
+
+    commit(repo, "docs/a.md", ["# a", "", "more"], 1600001000)
+    commit(repo, "docs/b.md", ["# b"], 1600002000)
+
+    utils.clear_git_history_memo()
+    assert utils.load_git_dates(docs, dates_index=index_file) == utils.load_git_dates(docs)
+
+
+def test_stale_index_in_shallow_clone_warns(tmp_path, caplog):
+    repo, docs = _init(tmp_path)
+    index_file = _export(repo, docs, tmp_path)
+    commit(repo, "docs/b.md", ["# b"], 1600002000)
+
+    clone = tmp_path / "clone"
+    git(tmp_path, "clone", "-q", "--depth", "1", f"file://{repo}", str(clone))
+
+    with caplog.at_level(logging.WARNING, logger="mkdocs.plugins.document_dates"):
+        created, updated = utils.load_git_dates(clone / "docs", dates_index=index_file)
+    assert "re-export it with mdd-index" in caplog.text
+    assert updated == {"a.md": 1600000000}
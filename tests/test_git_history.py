@@ -0,0 +1,36 @@
+from mkdocs_document_dates import utils
+
+from gitutils import git as _git, commit as _commit
+
+
+def test_incremental_index_after_merging_older_side_branch(tmp_path):
+    repo = tmp_path / "repo"
+    docs = repo / "docs"
+    docs.mkdir(parents=True)
+    _git(repo, "init", "-q", "-b", "main")
+
+    lines = ["# a", "", "one", "", "two", "", "three"]
+    _commit(repo, "docs/a.md", lines, 1600000000)
+    _git(repo, "branch", "side")
+    _commit(repo, "docs/a.md", ["# A"] + lines[1:], 1600003000)
+
+    # 在 main 上建立索引
+    cache_dir = tmp_path / "cache"
+    utils.clear_git_history_memo()
+    assert utils.load_git_history(docs, cache_dir)["a.md"]["updated"] == 1600003000
+
+    # 合并一个提交时间更早的分支
+    _git(repo, "checkout", "-q", "side")
+    _commit(repo, "docs/a.md", lines[:-1] + ["THREE"], 1600001000)
+    _git(repo, "checkout", "-q", "main")
+    _git(repo, "merge", "-q", "--no-ff", "-m", "merge side", "side", timestamp=1600004000)
+
+    utils.clear_git_history_memo()
+    incremental = utils.load_git_history(docs, cache_dir)
+    utils.clear_git_history_memo()
+    full = utils.scan_git_history(docs)
+
+    assert full["a.md"]["updated"] == 1600003000
+    assert incremental["a.md"]["created"] == full["a.md"]["created"]
+    assert incremental["a.md"]["updated"] == full["a.md"]["updated"]
+    assert incremental["a.md"]["tracked"] == full["a.md"]["tracked"]
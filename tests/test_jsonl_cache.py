@@ -0,0 +1,54 @@
+import json
+
+from mkdocs_document_dates import utils
+
+from gitutils import git
+
+
+def _entry(ts, author="Alice"):
+    return {"created": ts, "authors": [{"name": author, "email": "a@example.com"}]}
+
+
+def _check(jsonl_file, cache_dir):
+    expected = utils.read_jsonl_cache(jsonl_file)
+    assert utils.load_jsonl_cache(jsonl_file, cache_dir) == expected
+
+    # 索引已覆盖整个文件，再次加载直接命中
+    (index_file,) = cache_dir.glob("dates_cache_index_*.json")
+    assert json.loads(index_file.read_text(encoding="utf-8"))["offset"] == jsonl_file.stat().st_size
+    assert utils.load_jsonl_cache(jsonl_file, cache_dir) == expected
+    assert not list(cache_dir.glob("*.tmp"))
+    return expected
+
+
+def test_incremental_index_matches_full_read(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q")
+    monkeypatch.chdir(repo)
+    jsonl_file = repo / ".dates_cache.jsonl"
+    cache_dir = tmp_path / "cache"
+
+    assert utils.append_jsonl_cache(jsonl_file, {f"doc{i}.md": _entry(1600000000 + i) for i in range(3)})
+    assert len(_check(jsonl_file, cache_dir)) == 3
+
+    # 追加更新与删除（tombstone），只解析新增的行
+    assert utils.append_jsonl_cache(jsonl_file, {"doc0.md": _entry(1500000000, "Bob"), "doc1.md": None})
+    cache = _check(jsonl_file, cache_dir)
+    assert sorted(cache) == ["doc0.md", "doc2.md"]
+    assert cache["doc0.md"]["created"] == 1500000000
+
+    # 反复改写同一批文档，直到需要压缩
+    for i in range(utils.JSONL_COMPACT_MIN_LINES // 2):
+        assert utils.append_jsonl_cache(jsonl_file, {"doc2.md": _entry(1600000000 + i), "doc3.md": None})
+    _, lines, live = utils.read_jsonl_cache_entries(jsonl_file, [])
+    assert utils.needs_compaction(lines, live)
+    cache = _check(jsonl_file, cache_dir)
+
+    # 压缩后文件被重写，索引失效并全量解析
+    utils.write_jsonl_cache(jsonl_file, cache, sorted(cache))
+    assert len(jsonl_file.read_text(encoding="utf-8").splitlines()) == len(cache)
+    assert _check(jsonl_file, cache_dir) == cache
+
+    assert utils.append_jsonl_cache(jsonl_file, {"doc4.md": _entry(1700000000)})
+    assert sorted(_check(jsonl_file, cache_dir)) == ["doc0.md", "doc2.md", "doc4.md"]
@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+
+from mkdocs.structure.files import File, Files
+
+from mkdocs_document_dates.utils import RecentlyUpdatedIndex
+
+
+def _index(tmp_path):
+    dates = {}
+    files = []
+    for ts, src in enumerate(["index.md", "api/a.md", "guide/b.md"]):
+        (tmp_path / src).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / src).write_text(f"# {src}\n", encoding="utf-8")
+        files.append(File(src, str(tmp_path), str(tmp_path / "site"), True))
+        dates[src] = {"updated": datetime.fromtimestamp(1600000000 + ts, tz=timezone.utc)}
+    return RecentlyUpdatedIndex(dates, Files(files))
+
+
+def _paths(docs):
+    return [doc["url"] for doc in docs]
+
+
+def test_query_by_directory(tmp_path):
+    index = _index(tmp_path)
+    assert _paths(index.query(paths=["api/"])) == ["api/a/"]
+    assert _paths(index.query(paths=["/guide", "api"])) == ["guide/b/", "api/a/"]
+
+
+def test_root_path_matches_all_docs(tmp_path):
+    index = _index(tmp_path)
+    everything = _paths(index.query())
+    assert everything == ["guide/b/", "api/a/", "./"]
+    for root in ("/", "", ["api/", "/"]):
+        paths = root if isinstance(root, list) else [root]
+        assert _paths(index.query(paths=paths)) == everything